@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """
-Unified Merkle Tree Builder
+Unified Merkle Tree Builder and Visualization Demo
 Aligned with Glogos Specification v1.0.0-rc.0 §4
 
-Combines multiple attestation sources into a single Merkle tree.
+Combines multiple attestation sources into a single Merkle tree, then
+walks through tree construction and proof verification step by step.
 """
 
 import hashlib
@@ -65,14 +66,14 @@ def build_unified_tree(attestation_ids: List[str], verbose: bool = True) -> Merk
     for aid in attestation_ids:
         engine.add_leaf(aid)
     
-    # Compute root
-    root = engine.compute_root()
+    # Compute root (independent subtrees are hashed across cores for large inputs)
+    root = engine.compute_root_parallel()
     
     elapsed = (time.perf_counter() - start) * 1000
     
-    # Calculate tree height
-    import math
-    height = math.ceil(math.log2(max(len(attestation_ids), 1))) + 1 if attestation_ids else 0
+    # Calculate tree height: ceil(log2(n)) + 1 levels, in integer arithmetic
+    n = len(attestation_ids)
+    height = (n - 1).bit_length() + 1 if n else 0
     
     if verbose:
         print(f"\n[CHART] Build Results:")
@@ -107,7 +108,7 @@ def load_attestations_from_file(filepath: str) -> List[str]:
     return []
 
 
-def main():
+def main(visualize: bool = True) -> MerkleTreeResult:
     print("""
 +===============================================================+
 |       GLOGOS UNIFIED MERKLE TREE BUILDER - v1.0.0-rc.0       |
@@ -131,7 +132,6 @@ def main():
     # Generate some test attestations if needed
     if len(all_attestation_ids) < 3:
         print(f"\n📝 Generating test attestations to demonstrate tree...")
-        import hashlib
         for i in range(5 - len(all_attestation_ids)):
             test_claim = f"Test claim #{i+1} at {datetime.now().isoformat()}"
             test_id = hashlib.sha256(test_claim.encode()).hexdigest()
@@ -141,163 +141,26 @@ def main():
     # Build unified tree
     result = build_unified_tree(all_attestation_ids, verbose=True)
     
-    # Save result
-    output = {
-        "version": "1.0-rc.0",
-        "merkle_root": result.root,
-        "leaf_count": result.leaf_count,
-        "tree_height": result.tree_height,
-        "build_time_ms": result.build_time_ms,
-        "built_at": datetime.now().isoformat(),
-        "leaves": result.leaves[:10] if result.leaf_count > 10 else result.leaves,
-        "leaves_truncated": result.leaf_count > 10
-    }
-    
-    output_path = os.path.join(examples_dir, 'unified_merkle_tree.json')
-    with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
-    
-    print(f"\n{'='*60}")
-    print(f"Saved to: {output_path}")
-    print(f"{'='*60}")
-    
-    print("\n✅ Demo complete!")
-
-
-if __name__ == "__main__":
-    main()
-
-
-@dataclass
-class MerkleTreeResult:
-    root: str
-    leaf_count: int
-    tree_height: int
-    build_time_ms: float
-    leaves: List[str]
-
-
-def build_unified_tree(attestation_ids: List[str], verbose: bool = True) -> MerkleTreeResult:
-    """
-    Build unified Merkle tree from multiple attestation sources.
-    
-    Args:
-        attestation_ids: List of 64-char hex attestation IDs
-        verbose: Print progress
-    
-    Returns:
-        MerkleTreeResult with root and metadata
-    """
-    import time
-    
-    if verbose:
+    # ASCII Tree visualization
+    if visualize:
         print(f"\n{'='*60}")
-        print("UNIFIED MERKLE TREE BUILDER")
+        print("TREE VISUALIZATION")
         print(f"{'='*60}")
-        print(f"\nInputs: {len(attestation_ids)} attestations")
-    
-    engine = MerkleEngine()
-    
-    start = time.perf_counter()
-    
-    # Add all leaves
-    for aid in attestation_ids:
-        engine.add_leaf(aid)
-    
-    # Compute root
-    root = engine.compute_root()
-    
-    elapsed = (time.perf_counter() - start) * 1000
-    
-    # Calculate tree height
-    import math
-    height = math.ceil(math.log2(max(len(attestation_ids), 1))) + 1 if attestation_ids else 0
-    
-    if verbose:
-        print(f"\n[CHART] Build Results:")
-        print(f"   Leaves: {len(attestation_ids)}")
-        print(f"   Tree height: {height} levels")
-        print(f"   Build time: {elapsed:.2f}ms")
-        print(f"   Root: {root}")
-    
-    return MerkleTreeResult(
-        root=root,
-        leaf_count=len(attestation_ids),
-        tree_height=height,
-        build_time_ms=elapsed,
-        leaves=sorted([aid.lower() for aid in attestation_ids])
-    )
-
-
-def load_attestations_from_file(filepath: str) -> List[str]:
-    """Load attestation IDs from JSON file."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-    
-    # Support different formats
-    if isinstance(data, list):
-        return data
-    elif isinstance(data, dict):
-        if 'attestation_id' in data:
-            return [data['attestation_id']]
-        elif 'attestations' in data:
-            return [a.get('attestation_id') for a in data['attestations'] if a.get('attestation_id')]
-    
-    return []
-
-
-def main():
-    print("""
-+===============================================================+
-|       GLOGOS UNIFIED MERKLE TREE BUILDER - v1.0.0-rc.0       |
-+===============================================================+
-    """)
-    
-    # Check for existing attestation files
-    examples_dir = os.path.dirname(__file__)
-    glogos_proposal_dir = os.path.join(examples_dir, 'glogos-proposal')
-    
-    all_attestation_ids = []
-    
-    # Load from glogos-proposal if exists
-    proposal_attestation = os.path.join(glogos_proposal_dir, 'proposal_attestation.json')
-    if os.path.exists(proposal_attestation):
-        print(f"[DOC] Loading: {proposal_attestation}")
-        ids = load_attestations_from_file(proposal_attestation)
-        all_attestation_ids.extend(ids)
-        print(f"   Found: {len(ids)} attestation(s)")
-    
-    # Generate some test attestations if needed
-    if len(all_attestation_ids) < 3:
-        print(f"\n📝 Generating test attestations to demonstrate tree...")
-        for i in range(5 - len(all_attestation_ids)):
-            test_claim = f"Test claim #{i+1} at {datetime.now().isoformat()}"
-            test_id = hashlib.sha256(test_claim.encode()).hexdigest()
-            all_attestation_ids.append(test_id)
-            print(f"   Generated: {test_id[:24]}...")
-    
-    # Build unified tree
-    result = build_unified_tree(all_attestation_ids, verbose=True)
-    
-    # ASCII Tree visualization
-    print(f"\n{'='*60}")
-    print("TREE VISUALIZATION")
-    print(f"{'='*60}")
-    
-    if result.leaf_count <= 8:
-        # Show simple tree
-        sorted_leaves = result.leaves
-        print("\nLeaves (sorted):")
-        for i, leaf in enumerate(sorted_leaves):
-            print(f"  [{i}] {leaf[:24]}...")
         
-        print(f"\nTree structure:")
-        print(f"  Root: {result.root[:24]}...")
-        print(f"  Height: {result.tree_height} levels")
-        print(f"  Rule: Each parent = SHA256(left_child || right_child)")
-    else:
-        print(f"\n  Tree too large to display ({result.leaf_count} leaves)")
-        print(f"  Root: {result.root}")
+        if result.leaf_count <= 8:
+            # Show simple tree
+            sorted_leaves = result.leaves
+            print("\nLeaves (sorted):")
+            for i, leaf in enumerate(sorted_leaves):
+                print(f"  [{i}] {leaf[:24]}...")
+            
+            print(f"\nTree structure:")
+            print(f"  Root: {result.root[:24]}...")
+            print(f"  Height: {result.tree_height} levels")
+            print(f"  Rule: Each parent = SHA256(left_child || right_child)")
+        else:
+            print(f"\n  Tree too large to display ({result.leaf_count} leaves)")
+            print(f"  Root: {result.root}")
     
     # Save result
     output = {
@@ -322,24 +185,25 @@ def main():
     return result
 
 
-if __name__ == "__main__":
-    main()
-#!/usr/bin/env python3
-"""
-Merkle Tree Visualization Demo
-Aligned with Glogos Specification v1.0.0-rc.0 §4
-"""
-
-import hashlib
-from typing import List, Tuple
+# =============================================================================
+# Merkle Tree Visualization Demo
+# =============================================================================
 
 def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
+# Rule 5 seed: SHA256("") is constant, hash it once
+EMPTY_ROOT = sha256_hex(b"")
+
 def sha256_short(data: bytes) -> str:
     """Short hash for display"""
     return sha256_hex(data)[:8]
 
+def decode_leaves(leaves_hex: List[str]) -> List[bytes]:
+    """Decode hex leaves with one fromhex call over the joined string"""
+    blob = bytes.fromhex("".join(leaves_hex))
+    return [blob[i:i + 32] for i in range(0, len(blob), 32)]
+
 def build_merkle_tree_visual(attestation_ids: List[str]) -> Tuple[str, List[List[str]]]:
     """
     Build Merkle tree and return root + all levels for visualization.
@@ -353,14 +217,14 @@ def build_merkle_tree_visual(attestation_ids: List[str]) -> Tuple[str, List[List
     """
     # Rule 5: Empty tree
     if not attestation_ids:
-        return sha256_hex(b""), [[sha256_hex(b"")[:16] + "..."]]
+        return EMPTY_ROOT, [[EMPTY_ROOT[:16] + "..."]]
     
     # Rule 2: Sort lexicographically
     sorted_leaves = sorted([id.lower() for id in attestation_ids])
     
     # Build tree level by level
     all_levels = []
-    level = [bytes.fromhex(h) for h in sorted_leaves]
+    level = decode_leaves(sorted_leaves)
     all_levels.append([h[:8] + "..." for h in sorted_leaves])
     
     level_num = 0
@@ -371,34 +235,33 @@ def build_merkle_tree_visual(attestation_ids: List[str]) -> Tuple[str, List[List
     for i, leaf in enumerate(sorted_leaves):
         print(f"  [{i}] {leaf[:16]}...")
     
+    # 16-char display prefix per node, produced once alongside each hash
+    prefixes = [leaf[:16] for leaf in sorted_leaves]
+    
     while len(level) > 1:
         level_num += 1
         next_level = []
-        next_level_display = []
+        next_prefixes = []
         
         print(f"\nLevel {level_num}:")
         
         for i in range(0, len(level), 2):
-            left = level[i]
-            
             # Rule 4: Odd count - duplicate last
-            if i + 1 < len(level):
-                right = level[i + 1]
-                dup_marker = ""
-            else:
-                right = level[i]
-                dup_marker = " [DUP]"
+            j = i + 1 if i + 1 < len(level) else i
+            dup_marker = "" if j != i else " [DUP]"
             
             # Rule 3: SHA256(left || right)
-            parent = hashlib.sha256(left + right).digest()
+            parent = hashlib.sha256(level[i] + level[j]).digest()
+            prefix = parent[:8].hex()
             next_level.append(parent)
-            next_level_display.append(parent.hex()[:8] + "...")
+            next_prefixes.append(prefix)
             
-            print(f"  SHA256({left.hex()[:8]}... || {right.hex()[:8]}...{dup_marker})")
-            print(f"    = {parent.hex()[:16]}...")
+            print(f"  SHA256({prefixes[i][:8]}... || {prefixes[j][:8]}...{dup_marker})")
+            print(f"    = {prefix}...")
         
         level = next_level
-        all_levels.append(next_level_display)
+        prefixes = next_prefixes
+        all_levels.append([p[:8] + "..." for p in prefixes])
     
     root = level[0].hex()
     print(f"\n{'='*60}")
@@ -427,7 +290,7 @@ def generate_proof_visual(attestation_id: str, all_ids: List[str]) -> dict:
     print(f"Target: {target[:16]}...")
     
     proof = []
-    level = [bytes.fromhex(h) for h in sorted_leaves]
+    level = decode_leaves(sorted_leaves)
     current_index = leaf_index
     
     step = 0
@@ -506,20 +369,17 @@ def verify_proof_visual(proof_data: dict) -> bool:
             sibling_hash = bytes.fromhex(sibling)
             sibling_display = sibling[:16] + "..."
         
-        if index % 2 == 0:
-            # Current is LEFT
-            direction = "LEFT"
-            new_current = hashlib.sha256(current + sibling_hash).digest()
-        else:
-            # Current is RIGHT
-            direction = "RIGHT"
-            new_current = hashlib.sha256(sibling_hash + current).digest()
+        # Low bit of index selects the order: 0 = current is LEFT, 1 = RIGHT
+        bit = index & 1
+        pair = (current, sibling_hash)
+        direction = ("LEFT", "RIGHT")[bit]
+        new_current = hashlib.sha256(pair[bit] + pair[bit ^ 1]).digest()
         
         print(f"  Step {step+1}: index={index} ({direction}) + {sibling_display}")
         print(f"         -> {new_current.hex()[:16]}...")
         
         current = new_current
-        index = index // 2
+        index >>= 1
     
     is_valid = current.hex() == expected_root
     
@@ -530,7 +390,7 @@ def verify_proof_visual(proof_data: dict) -> bool:
     return is_valid
 
 
-def main():
+def visual_demo():
     print("""
 +===============================================================+
 |        GLOGOS MERKLE TREE DEMO - Spec v1.0.0-rc.0 §4         |
@@ -582,10 +442,13 @@ def main():
     print("EMPTY TREE (Rule 5)")
     print(f"{'='*60}")
     empty_root, _ = build_merkle_tree_visual([])
-    print(f"Empty root = SHA256('') = {sha256_hex(b'')[:32]}...")
+    print(f"Empty root = SHA256('') = {EMPTY_ROOT[:32]}...")
     
     print("\n✅ Demo complete!")
 
 
+
+
 if __name__ == "__main__":
     main()
+    visual_demo()
@@ -32,10 +32,10 @@ GLSR: e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855
 import sys
 import os
 import hashlib
+import hmac
 import time
-import secrets
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime
 
 # Setup path
@@ -45,6 +45,7 @@ sys.path.insert(0, ZONE_POC_DIR)
 os.chdir(ZONE_POC_DIR)
 
 from zone.merkle import MerkleEngine
+from zone.signer import attestation_id_hasher
 
 # =============================================================================
 # CONSTANTS
@@ -52,19 +53,19 @@ from zone.merkle import MerkleEngine
 
 GLSR = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
-# Canon IDs
-CANON_AUCTION_RULES = hashlib.sha256(b"auction:rules:1.0").hexdigest()
-CANON_CREDIT_LISTING = hashlib.sha256(b"auction:carbon-credit:1.0").hexdigest()
-CANON_BID_COMMIT = hashlib.sha256(b"auction:bid-commit:1.0").hexdigest()
-CANON_BID_REVEAL = hashlib.sha256(b"auction:bid-reveal:1.0").hexdigest()
-CANON_AUCTION_RESULT = hashlib.sha256(b"auction:result:1.0").hexdigest()
-CANON_TRANSFER = hashlib.sha256(b"auction:transfer:1.0").hexdigest()
+# Canon IDs (raw 32-byte digests)
+CANON_AUCTION_RULES = hashlib.sha256(b"auction:rules:1.0").digest()
+CANON_CREDIT_LISTING = hashlib.sha256(b"auction:carbon-credit:1.0").digest()
+CANON_BID_COMMIT = hashlib.sha256(b"auction:bid-commit:1.0").digest()
+CANON_BID_REVEAL = hashlib.sha256(b"auction:bid-reveal:1.0").digest()
+CANON_AUCTION_RESULT = hashlib.sha256(b"auction:result:1.0").digest()
+CANON_TRANSFER = hashlib.sha256(b"auction:transfer:1.0").digest()
 
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Bidder:
     """Auction participant"""
     bidder_id: str
@@ -72,7 +73,7 @@ class Bidder:
     organization: str
     verified: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class CarbonCredit:
     """Carbon credit listing"""
     credit_id: str
@@ -83,17 +84,17 @@ class CarbonCredit:
     min_price: float
     attestation_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class BidCommitment:
     """Commit phase: Hash of bid (bid not revealed yet)"""
     commit_id: str
     bidder_id: str
     credit_id: str
-    commit_hash: str  # H(bid_amount || nonce)
+    commit_hash: bytes  # H(bid_amount || nonce), raw 32-byte digest
     timestamp: int
     attestation_id: str = ""
     
-@dataclass
+@dataclass(slots=True)
 class BidReveal:
     """Reveal phase: Actual bid amount + nonce"""
     reveal_id: str
@@ -103,14 +104,15 @@ class BidReveal:
     valid: bool  # Does H(amount || nonce) match commitment?
     attestation_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class AuctionResult:
     """Final auction result"""
     auction_id: str
     credit_id: str
     winner_id: str
     winning_bid: float
-    all_bids: List[Tuple[str, float]]  # (bidder_id, amount)
+    highest_bid: float
+    all_bids: List[Tuple[str, float]]  # (bidder_id, amount), unsorted
     attestation_id: str = ""
 
 # =============================================================================
@@ -124,7 +126,8 @@ class CarbonAuctionZone:
     """
     
     def __init__(self, zone_name: str):
-        self.zone_id = hashlib.sha256(zone_name.encode()).hexdigest()
+        self._zone_id_bytes = hashlib.sha256(zone_name.encode()).digest()
+        self.zone_id = self._zone_id_bytes.hex()
         self.zone_name = zone_name
         self.merkle = MerkleEngine()
         
@@ -132,29 +135,84 @@ class CarbonAuctionZone:
         self.bidders: Dict[str, Bidder] = {}
         self.credits: Dict[str, CarbonCredit] = {}
         self.commitments: Dict[str, BidCommitment] = {}  # commit_id -> commitment
+        self._commits_by_credit: Dict[str, List[str]] = {}  # credit_id -> commit_ids
         self.reveals: Dict[str, BidReveal] = {}  # commit_id -> reveal
         self.results: List[AuctionResult] = []
         self.transfers: List[dict] = []
         
-        self.attestation_ids: List[str] = []
+        # All attestation IDs in creation order, packed as 32-byte digests
+        self._attestation_digests = bytearray()
+        # canon_id -> attestation hasher specialized to zone_id || canon_id
+        self._canon_hashers: Dict[bytes, Callable[[bytes], bytes]] = {}
+        # Reusable "bidder_id:credit_id:commit_hash" preimage (3 x 64 hex
+        # chars). Writes go through a memoryview, which cannot resize the
+        # buffer: an ID of any other length raises instead.
+        self._commit_id_scratch = bytearray(b":".join([b"0" * 64] * 3))
+        self._commit_id_view = memoryview(self._commit_id_scratch)
+        self.phase_roots: Dict[str, str] = {}  # phase -> Merkle root at phase close
+        self._seq = 0  # Uniquifier for derived IDs (replaces wall-clock time)
+        self._nonce_pool = b""  # Buffered CSPRNG output for bid nonces
+        self._nonce_pos = 0
         
         # Attest auction rules at creation
         self._attest_rules()
         
-    def _create_attestation(self, canon_id: str, claim: str) -> str:
+    def _create_attestation(self, canon_id: bytes, claim: str) -> str:
         """Create attestation ID per Spec §3.3"""
-        timestamp = int(time.time())
-        claim_hash = hashlib.sha256(claim.encode()).hexdigest()
-        preimage = (
-            bytes.fromhex(self.zone_id) +
-            bytes.fromhex(canon_id) +
-            bytes.fromhex(claim_hash) +
-            timestamp.to_bytes(8, 'big')
-        )
-        att_id = hashlib.sha256(preimage).hexdigest()
-        self.attestation_ids.append(att_id)
-        self.merkle.add_leaf(att_id)
-        return att_id
+        return self._create_attestations(canon_id, [claim])[0]
+    
+    def _create_attestations(self, canon_id: bytes, claims: List[str]) -> List[str]:
+        """
+        Create attestation IDs per Spec §3.3 for a batch of claims.
+        The batch shares one timestamp and decoded prefix, and its leaves
+        are added to the Merkle tree together.
+        """
+        timestamp_bytes = int(time.time()).to_bytes(8, 'big')
+        hasher = self._canon_hasher(canon_id)
+        sha256 = hashlib.sha256
+        
+        digests = [
+            hasher(sha256(claim.encode()).digest() + timestamp_bytes)
+            for claim in claims
+        ]
+        self._attestation_digests += b"".join(digests)
+        att_ids = [digest.hex() for digest in digests]
+        self.merkle.add_leaves(att_ids)
+        return att_ids
+    
+    @property
+    def attestation_count(self) -> int:
+        """Number of attestations created by this zone"""
+        return len(self._attestation_digests) // 32
+    
+    def attestation_id_at(self, index: int) -> str:
+        """Attestation ID by creation order, as hex"""
+        return self._attestation_digests[32 * index:32 * (index + 1)].hex()
+    
+    def _next_seq(self) -> int:
+        """Next value of the zone's monotonic ID counter"""
+        self._seq += 1
+        return self._seq
+    
+    def _next_nonce(self) -> str:
+        """
+        Next 16-byte random nonce as hex.
+        Nonces are sliced from a 4 KiB os.urandom buffer, one syscall per 256 bids.
+        """
+        if self._nonce_pos + 16 > len(self._nonce_pool):
+            self._nonce_pool = os.urandom(4096)
+            self._nonce_pos = 0
+        nonce = self._nonce_pool[self._nonce_pos:self._nonce_pos + 16]
+        self._nonce_pos += 16
+        return nonce.hex()
+    
+    def _canon_hasher(self, canon_id: bytes) -> Callable[[bytes], bytes]:
+        """Attestation hasher for one canon, built on first use"""
+        hasher = self._canon_hashers.get(canon_id)
+        if hasher is None:
+            hasher = attestation_id_hasher(self._zone_id_bytes, canon_id)
+            self._canon_hashers[canon_id] = hasher
+        return hasher
     
     def _attest_rules(self):
         """Attest auction rules (Mechanism Transparency)"""
@@ -168,6 +226,17 @@ class CarbonAuctionZone:
         )
         self.rules_attestation = self._create_attestation(CANON_AUCTION_RULES, rules)
     
+    def close_phase(self, phase: str) -> str:
+        """
+        Snapshot the Merkle root at the end of an auction phase.
+        All phases share one engine, so later phases extend the same tree
+        and each snapshot can be checked against proofs issued in its phase.
+        Large phases hash independent subtrees across cores.
+        """
+        root = self.merkle.compute_root_parallel()
+        self.phase_roots[phase] = root
+        return root
+    
     # =========================================================================
     # REGISTRATION
     # =========================================================================
@@ -196,7 +265,7 @@ class CarbonAuctionZone:
     ) -> CarbonCredit:
         """List a carbon credit for auction"""
         credit_id = hashlib.sha256(
-            f"{description}:{tonnes_co2}:{vintage_year}:{time.time()}".encode()
+            f"{description}:{tonnes_co2}:{vintage_year}:{self._next_seq()}".encode()
         ).hexdigest()
         
         claim = (
@@ -236,36 +305,83 @@ class CarbonAuctionZone:
             raise ValueError("Credit not found")
         
         # Generate random nonce
-        nonce = secrets.token_hex(16)
+        nonce = self._next_nonce()
+        
+        commitment, claim = self._draft_commit(bidder, credit_id, bid_amount, nonce)
+        commitment.attestation_id = self._create_attestation(CANON_BID_COMMIT, claim)
+        self._store_commitment(commitment)
+        
+        return commitment, nonce
+    
+    def commit_bids(
+        self,
+        credit_id: str,
+        bids: List[Tuple[Bidder, float]]
+    ) -> List[Tuple[BidCommitment, str]]:
+        """
+        Commit many sealed bids at once.
+        The commit attestations are created as one batch.
+        """
+        if credit_id not in self.credits:
+            raise ValueError("Credit not found")
         
+        nonces = [self._next_nonce() for _ in bids]
+        drafts = [
+            self._draft_commit(bidder, credit_id, bid_amount, nonce)
+            for (bidder, bid_amount), nonce in zip(bids, nonces)
+        ]
+        att_ids = self._create_attestations(
+            CANON_BID_COMMIT, [claim for _, claim in drafts]
+        )
+        
+        results = []
+        for (commitment, _), att_id, nonce in zip(drafts, att_ids, nonces):
+            commitment.attestation_id = att_id
+            self._store_commitment(commitment)
+            results.append((commitment, nonce))
+        return results
+    
+    def _store_commitment(self, commitment: BidCommitment) -> None:
+        """Record a commitment and index it under its credit for settlement"""
+        self.commitments[commitment.commit_id] = commitment
+        self._commits_by_credit.setdefault(commitment.credit_id, []).append(
+            commitment.commit_id
+        )
+    
+    def _draft_commit(
+        self,
+        bidder: Bidder,
+        credit_id: str,
+        bid_amount: float,
+        nonce: str
+    ) -> Tuple[BidCommitment, str]:
+        """Build the commitment H(amount || nonce) and its attestation claim"""
         # Create commitment: H(amount || nonce)
         commit_hash = hashlib.sha256(
             f"{bid_amount:.2f}:{nonce}".encode()
-        ).hexdigest()
+        ).digest()
         
-        commit_id = hashlib.sha256(
-            f"{bidder.bidder_id}:{credit_id}:{commit_hash}".encode()
-        ).hexdigest()
+        view = self._commit_id_view
+        view[0:64] = bidder.bidder_id.encode()
+        view[65:129] = credit_id.encode()
+        view[130:194] = commit_hash.hex().encode()
+        commit_id = hashlib.sha256(self._commit_id_scratch).hexdigest()
         
         claim = (
             f"COMMIT|{commit_id}|"
             f"bidder:{bidder.bidder_id[:8]}|"
             f"credit:{credit_id[:8]}|"
-            f"hash:{commit_hash[:16]}"
+            f"hash:{commit_hash.hex()[:16]}"
         )
-        att_id = self._create_attestation(CANON_BID_COMMIT, claim)
         
         commitment = BidCommitment(
             commit_id=commit_id,
             bidder_id=bidder.bidder_id,
             credit_id=credit_id,
             commit_hash=commit_hash,
-            timestamp=int(time.time()),
-            attestation_id=att_id
+            timestamp=int(time.time())
         )
-        self.commitments[commit_id] = commitment
-        
-        return commitment, nonce
+        return commitment, claim
     
     # =========================================================================
     # REVEAL PHASE (Information Disclosure)
@@ -289,12 +405,12 @@ class CarbonAuctionZone:
         # Verify commitment
         computed_hash = hashlib.sha256(
             f"{bid_amount:.2f}:{nonce}".encode()
-        ).hexdigest()
+        ).digest()
         
-        valid = computed_hash == commitment.commit_hash
+        valid = hmac.compare_digest(computed_hash, commitment.commit_hash)
         
         reveal_id = hashlib.sha256(
-            f"REVEAL:{commit_id}:{bid_amount}:{time.time()}".encode()
+            f"REVEAL:{commit_id}:{bid_amount}:{self._next_seq()}".encode()
         ).hexdigest()
         
         claim = (
@@ -332,31 +448,30 @@ class CarbonAuctionZone:
         
         # Get all valid reveals for this credit
         valid_bids = []
-        for commit_id, commitment in self.commitments.items():
-            if commitment.credit_id != credit_id:
-                continue
+        for commit_id in self._commits_by_credit.get(credit_id, ()):
             reveal = self.reveals.get(commit_id)
             if reveal and reveal.valid and reveal.bid_amount >= credit.min_price:
-                valid_bids.append((commitment.bidder_id, reveal.bid_amount))
+                valid_bids.append((self.commitments[commit_id].bidder_id, reveal.bid_amount))
         
         if not valid_bids:
             print("   No valid bids received")
             return None
         
-        # Sort by bid amount (descending)
-        valid_bids.sort(key=lambda x: x[1], reverse=True)
-        
-        # Winner = highest bidder
+        # Single pass for the top two bids; ties keep the earliest bidder
         winner_id, highest_bid = valid_bids[0]
+        second_bid = None
+        for bidder_id, amount in valid_bids[1:]:
+            if amount > highest_bid:
+                second_bid = highest_bid
+                winner_id, highest_bid = bidder_id, amount
+            elif second_bid is None or amount > second_bid:
+                second_bid = amount
         
         # Price = second highest bid (or min_price if only one bidder)
-        if len(valid_bids) >= 2:
-            winning_price = valid_bids[1][1]  # Second price
-        else:
-            winning_price = credit.min_price
+        winning_price = second_bid if second_bid is not None else credit.min_price
         
         auction_id = hashlib.sha256(
-            f"AUCTION:{credit_id}:{winner_id}:{time.time()}".encode()
+            f"AUCTION:{credit_id}:{winner_id}:{self._next_seq()}".encode()
         ).hexdigest()
         
         claim = (
@@ -374,6 +489,7 @@ class CarbonAuctionZone:
             credit_id=credit_id,
             winner_id=winner_id,
             winning_bid=winning_price,
+            highest_bid=highest_bid,
             all_bids=valid_bids,
             attestation_id=att_id
         )
@@ -395,7 +511,7 @@ class CarbonAuctionZone:
         credit = self.credits[result.credit_id]
         
         transfer_id = hashlib.sha256(
-            f"TRANSFER:{result.auction_id}:{to_account}:{time.time()}".encode()
+            f"TRANSFER:{result.auction_id}:{to_account}:{self._next_seq()}".encode()
         ).hexdigest()
         
         claim = (
@@ -496,14 +612,17 @@ def main():
     ]
     
     commitments_and_nonces = []
-    for bidder, amount in bid_data:
-        commitment, nonce = zone.commit_bid(bidder, credit.credit_id, amount)
+    committed = zone.commit_bids(credit.credit_id, bid_data)
+    for (bidder, amount), (commitment, nonce) in zip(bid_data, committed):
         commitments_and_nonces.append((commitment, nonce, amount))
         print(f"\n   [COMMIT] {bidder.name}")
-        print(f"   Commit hash: {commitment.commit_hash[:24]}...")
+        print(f"   Commit hash: {commitment.commit_hash.hex()[:24]}...")
         print(f"   Attestation: {commitment.attestation_id[:16]}...")
         # Note: Actual bid amount is hidden at this stage!
     
+    commit_root = zone.close_phase("commit")
+    print(f"\n   Commit phase root: {commit_root[:16]}...")
+    
     # =========================================================================
     # STEP 4: Reveal Phase (Public Disclosure)
     # =========================================================================
@@ -522,6 +641,9 @@ def main():
         print(f"   Verification: {status}")
         print(f"   Attestation: {reveal.attestation_id[:16]}...")
     
+    reveal_root = zone.close_phase("reveal")
+    print(f"\n   Reveal phase root: {reveal_root[:16]}...")
+    
     # =========================================================================
     # STEP 5: Auction Settlement
     # =========================================================================
@@ -535,13 +657,13 @@ def main():
         winner = zone.bidders[result.winner_id]
         print(f"\n   [RESULT] Auction settled!")
         print(f"\n   All bids (sorted):")
-        for bidder_id, bid_amount in result.all_bids:
+        for bidder_id, bid_amount in sorted(result.all_bids, key=lambda b: b[1], reverse=True):
             bidder = zone.bidders[bidder_id]
             marker = " ← WINNER" if bidder_id == result.winner_id else ""
             print(f"      ${bid_amount:.2f} - {bidder.name}{marker}")
         
         print(f"\n   Winner: {winner.name}")
-        print(f"   Highest bid: ${result.all_bids[0][1]:.2f}")
+        print(f"   Highest bid: ${result.highest_bid:.2f}")
         print(f"   Winning price (2nd bid): ${result.winning_bid:.2f}")
         print(f"   Attestation: {result.attestation_id[:16]}...")
         
@@ -574,7 +696,7 @@ def main():
     print("STEP 7: Cryptographic Verification")
     print("=" * 80)
     
-    root = zone.merkle.compute_root()
+    root = zone.close_phase("settlement")
     
     if result:
         proof = zone.merkle.generate_proof(result.attestation_id)
@@ -609,7 +731,7 @@ def main():
         print(f"   {status} {problem}")
         print(f"      └── {solution}")
     
-    print(f"\n   Total attestations: {len(zone.attestation_ids)}")
+    print(f"\n   Total attestations: {zone.attestation_count}")
     print(f"   Merkle root: {root[:16]}...")
     print("=" * 80)
     print("Carbon credit auction POC complete!")
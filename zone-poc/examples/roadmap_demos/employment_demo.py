@@ -20,15 +20,25 @@ SOLUTION: Multi-party Attestation
 | Residual rights       | Attestation-based claims     |
 | Principal-agent       | Multi-party verification     |
 
+ENTITY IDS
+Contract, work, review, milestone, payment and dispute IDs are
+SHA-256 over a fixed 73-byte preimage:
+    kind (1 byte) || parent_id (32) || detail digest (32) || timestamp_ns (8, big-endian)
+kind: 1 contract, 2 work, 3 review, 4 milestone, 5 payment, 6 dispute
+
 GLSR: e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855
 """
 
 import sys
 import os
+import io
+import argparse
+import contextlib
 import hashlib
+import struct
 import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 
 # Setup path
@@ -38,6 +48,7 @@ sys.path.insert(0, ZONE_POC_DIR)
 os.chdir(ZONE_POC_DIR)
 
 from zone.merkle import MerkleEngine
+from zone.signer import attestation_id_hasher
 
 # =============================================================================
 # CONSTANTS
@@ -45,75 +56,114 @@ from zone.merkle import MerkleEngine
 
 GLSR = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
-# Canon IDs
-CANON_EMPLOYMENT = hashlib.sha256(b"employment:contract:1.0").hexdigest()
-CANON_WORK_DELIVERY = hashlib.sha256(b"employment:work-delivery:1.0").hexdigest()
-CANON_PEER_REVIEW = hashlib.sha256(b"employment:peer-review:1.0").hexdigest()
-CANON_MILESTONE = hashlib.sha256(b"employment:milestone:1.0").hexdigest()
-CANON_PAYMENT = hashlib.sha256(b"employment:payment:1.0").hexdigest()
-CANON_DISPUTE = hashlib.sha256(b"employment:dispute:1.0").hexdigest()
+# Canon IDs (raw 32-byte digests)
+CANON_EMPLOYMENT = hashlib.sha256(b"employment:contract:1.0").digest()
+CANON_WORK_DELIVERY = hashlib.sha256(b"employment:work-delivery:1.0").digest()
+CANON_PEER_REVIEW = hashlib.sha256(b"employment:peer-review:1.0").digest()
+CANON_MILESTONE = hashlib.sha256(b"employment:milestone:1.0").digest()
+CANON_PAYMENT = hashlib.sha256(b"employment:payment:1.0").digest()
+CANON_DISPUTE = hashlib.sha256(b"employment:dispute:1.0").digest()
+
+# Derived-ID preimage: kind, parent ID, detail digest, timestamp (ns).
+# A one-byte kind keeps the layout fixed without truncating or
+# zero-padding tag names.
+_ID_STRUCT = struct.Struct("!B32s32sQ")
+ID_CONTRACT = 1
+ID_WORK = 2
+ID_REVIEW = 3
+ID_MILESTONE = 4
+ID_PAYMENT = 5
+ID_DISPUTE = 6
 
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Employee:
     """Employee in the contract"""
-    employee_id: str
+    employee_id: bytes
     name: str
     role: str
     skills: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Employer:
     """Employer in the contract"""
-    employer_id: str
+    employer_id: bytes
     company_name: str
     industry: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmploymentContract:
     """The employment contract (necessarily incomplete)"""
-    contract_id: str
-    employer_id: str
-    employee_id: str
+    contract_id: bytes
+    employer_id: bytes
+    employee_id: bytes
     role: str
     monthly_salary: float
-    start_date: str
+    start_ts_ns: int  # Creation time, formatted on demand by start_date
     milestones: List[str]  # High-level goals only
-    attestation_id: str = ""
+    attestation_id: bytes = b""
+    short_id: str = field(init=False)  # First 8 hex chars, as used in claims
+    
+    def __post_init__(self):
+        object.__setattr__(self, "short_id", self.contract_id[:4].hex())
+    
+    @property
+    def start_date(self) -> str:
+        """Contract start as a local ISO 8601 timestamp"""
+        return datetime.fromtimestamp(self.start_ts_ns / 1e9).isoformat()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkDelivery:
     """Attestation of work delivered"""
-    delivery_id: str
-    contract_id: str
+    delivery_id: bytes
+    contract_id: bytes
     description: str
     hours_worked: int
     artifacts: List[str]  # Links to deliverables
-    attestation_id: str = ""
+    attestation_id: bytes = b""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PeerReview:
     """Peer attestation of work quality"""
-    review_id: str
-    delivery_id: str
-    reviewer_id: str
+    review_id: bytes
+    delivery_id: bytes
+    reviewer_id: bytes
     rating: int  # 1-5
     feedback: str
-    attestation_id: str = ""
+    attestation_id: bytes = b""
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MilestoneCompletion:
     """Milestone completion attestation"""
-    milestone_id: str
-    contract_id: str
+    milestone_id: bytes
+    contract_id: bytes
     milestone_name: str
-    completed_deliveries: List[str]
-    peer_reviews: List[str]
+    completed_deliveries: List[bytes]
+    peer_reviews: List[bytes]
     employer_approved: bool
-    attestation_id: str = ""
+    attestation_id: bytes = b""
+
+@dataclass(slots=True, frozen=True)
+class Payment:
+    """Payment against a contract or milestone"""
+    payment_id: bytes
+    contract_id: bytes
+    amount: float
+    milestone_id: Optional[bytes]
+    attestation_id: bytes
+
+@dataclass(slots=True)
+class Dispute:
+    """Dispute filed on a contract"""
+    dispute_id: bytes
+    contract_id: bytes
+    filed_by: bytes
+    reason: str
+    attestation_id: bytes
+    status: str = "OPEN"
 
 # =============================================================================
 # EMPLOYMENT ZONE
@@ -126,43 +176,88 @@ class EmploymentZone:
     """
     
     def __init__(self, zone_name: str):
-        self.zone_id = hashlib.sha256(zone_name.encode()).hexdigest()
+        self.zone_id = hashlib.sha256(zone_name.encode()).digest()
         self.zone_name = zone_name
         self.merkle = MerkleEngine()
         
-        # State
-        self.employers: Dict[str, Employer] = {}
-        self.employees: Dict[str, Employee] = {}
-        self.contracts: Dict[str, EmploymentContract] = {}
+        # State (all IDs are raw 32-byte digests; hex only for display)
+        self.employers: Dict[bytes, Employer] = {}
+        self.employees: Dict[bytes, Employee] = {}
+        self.contracts: Dict[bytes, EmploymentContract] = {}
         self.deliveries: List[WorkDelivery] = []
         self.reviews: List[PeerReview] = []
         self.milestones: List[MilestoneCompletion] = []
-        self.payments: List[dict] = []
-        self.disputes: List[dict] = []
+        self.payments: List[Payment] = []
+        self.disputes: List[Dispute] = []
         
-        self.attestation_ids: List[str] = []
+        # Lookup indexes for get_work_history
+        self._deliveries_by_contract: Dict[bytes, List[WorkDelivery]] = {}
+        self._reviews_by_delivery: Dict[bytes, List[PeerReview]] = {}
+        self._milestones_by_contract: Dict[bytes, List[MilestoneCompletion]] = {}
+        self._payments_by_contract: Dict[bytes, List[Payment]] = {}
+        self._delivery_contracts: Dict[bytes, bytes] = {}  # delivery_id -> contract_id
+        # Running per-contract aggregates: hours, [rating sum, review count], paid
+        self._hours_by_contract: Dict[bytes, int] = {}
+        self._ratings_by_contract: Dict[bytes, List[int]] = {}
+        self._paid_by_contract: Dict[bytes, float] = {}
         
-    def _create_attestation(self, canon_id: str, claim: str) -> str:
+        self.attestation_ids: List[bytes] = []
+        # canon_id -> attestation hasher specialized to zone_id || canon_id
+        self._canon_hashers: Dict[bytes, Callable[[bytes], bytes]] = {}
+        
+    def _create_attestation(self, canon_id: bytes, claim: str, timestamp_ns: int) -> bytes:
         """Create attestation ID per Spec §3.3"""
-        timestamp = int(time.time())
-        claim_hash = hashlib.sha256(claim.encode()).hexdigest()
-        preimage = (
-            bytes.fromhex(self.zone_id) +
-            bytes.fromhex(canon_id) +
-            bytes.fromhex(claim_hash) +
-            timestamp.to_bytes(8, 'big')
-        )
-        att_id = hashlib.sha256(preimage).hexdigest()
-        self.attestation_ids.append(att_id)
-        self.merkle.add_leaf(att_id)
-        return att_id
+        return self._create_attestations(canon_id, [claim], timestamp_ns)[0]
+    
+    def _create_attestations(
+        self,
+        canon_id: bytes,
+        claims: List[str],
+        timestamp_ns: int
+    ) -> List[bytes]:
+        """
+        Create attestation IDs per Spec §3.3 for a batch of claims.
+        IDs are returned as raw digests; the Merkle engine takes hex leaves.
+        The batch shares one timestamp and canon hasher, and its leaves are
+        added to the Merkle tree together.
+        """
+        timestamp_bytes = (timestamp_ns // 1_000_000_000).to_bytes(8, 'big')
+        hasher = self._canon_hasher(canon_id)
+        sha256 = hashlib.sha256
+        
+        att_ids = [
+            hasher(sha256(claim.encode()).digest() + timestamp_bytes)
+            for claim in claims
+        ]
+        self.attestation_ids.extend(att_ids)
+        self.merkle.add_leaves([att_id.hex() for att_id in att_ids])
+        return att_ids
+    
+    def _canon_hasher(self, canon_id: bytes) -> Callable[[bytes], bytes]:
+        """Attestation hasher for one canon, built on first use"""
+        hasher = self._canon_hashers.get(canon_id)
+        if hasher is None:
+            hasher = attestation_id_hasher(self.zone_id, canon_id)
+            self._canon_hashers[canon_id] = hasher
+        return hasher
+    
+    @staticmethod
+    def _derive_id(kind: int, parent_id: bytes, detail: bytes, timestamp_ns: int) -> bytes:
+        """
+        Derive an entity ID from a fixed 73-byte binary preimage.
+        kind is one of the ID_* constants; detail is a 32-byte digest
+        (e.g. of a description or a second ID).
+        """
+        return hashlib.sha256(_ID_STRUCT.pack(
+            kind, parent_id, detail, timestamp_ns
+        )).digest()
     
     # =========================================================================
     # REGISTRATION
     # =========================================================================
     
     def register_employer(self, company_name: str, industry: str) -> Employer:
-        employer_id = hashlib.sha256(company_name.encode()).hexdigest()
+        employer_id = hashlib.sha256(company_name.encode()).digest()
         employer = Employer(
             employer_id=employer_id,
             company_name=company_name,
@@ -172,7 +267,7 @@ class EmploymentZone:
         return employer
     
     def register_employee(self, name: str, role: str, skills: List[str]) -> Employee:
-        employee_id = hashlib.sha256(f"{name}:{role}".encode()).hexdigest()
+        employee_id = hashlib.sha256(f"{name}:{role}".encode()).digest()
         employee = Employee(
             employee_id=employee_id,
             name=name,
@@ -198,18 +293,19 @@ class EmploymentZone:
         Note: Contract is INCOMPLETE by design - can't specify all details.
         Glogos handles this via ongoing attestations.
         """
-        contract_id = hashlib.sha256(
-            f"{employer.employer_id}:{employee.employee_id}:{time.time()}".encode()
-        ).hexdigest()
+        now_ns = time.time_ns()
+        contract_id = self._derive_id(
+            ID_CONTRACT, employer.employer_id, employee.employee_id, now_ns
+        )
         
         claim = (
-            f"CONTRACT|{contract_id}|"
+            f"CONTRACT|{contract_id.hex()}|"
             f"employer:{employer.company_name}|"
             f"employee:{employee.name}|"
             f"salary:{monthly_salary}|"
             f"milestones:{len(milestones)}"
         )
-        att_id = self._create_attestation(CANON_EMPLOYMENT, claim)
+        att_id = self._create_attestation(CANON_EMPLOYMENT, claim, now_ns)
         
         contract = EmploymentContract(
             contract_id=contract_id,
@@ -217,7 +313,7 @@ class EmploymentZone:
             employee_id=employee.employee_id,
             role=employee.role,
             monthly_salary=monthly_salary,
-            start_date=datetime.now().isoformat(),
+            start_ts_ns=now_ns,
             milestones=milestones,
             attestation_id=att_id
         )
@@ -230,7 +326,7 @@ class EmploymentZone:
     
     def submit_work(
         self,
-        contract_id: str,
+        contract_id: bytes,
         description: str,
         hours_worked: int,
         artifacts: List[str]
@@ -240,29 +336,60 @@ class EmploymentZone:
         This solves Hart's "unverifiable effort" problem -
         work is now cryptographically attested.
         """
-        if contract_id not in self.contracts:
+        return self.submit_work_batch(
+            contract_id, [(description, hours_worked, artifacts)]
+        )[0]
+    
+    def submit_work_batch(
+        self,
+        contract_id: bytes,
+        work_items: List[Tuple[str, int, List[str]]]
+    ) -> List[WorkDelivery]:
+        """
+        Submit several (description, hours_worked, artifacts) deliveries.
+        The work attestations are created as one batch.
+        """
+        contract = self.contracts.get(contract_id)
+        if contract is None:
             raise ValueError("Contract not found")
         
-        delivery_id = hashlib.sha256(
-            f"{contract_id}:{description}:{time.time()}".encode()
-        ).hexdigest()
+        # One clock read per batch; item i is stamped base_ns + i
+        base_ns = time.time_ns()
+        delivery_ids = []
+        claims = []
+        for i, (description, hours_worked, artifacts) in enumerate(work_items):
+            delivery_id = self._derive_id(
+                ID_WORK, contract_id,
+                hashlib.sha256(description.encode()).digest(), base_ns + i
+            )
+            delivery_ids.append(delivery_id)
+            claims.append(
+                f"WORK|{delivery_id.hex()}|contract:{contract.short_id}|"
+                f"hours:{hours_worked}|artifacts:{len(artifacts)}"
+            )
         
-        claim = (
-            f"WORK|{delivery_id}|contract:{contract_id[:8]}|"
-            f"hours:{hours_worked}|artifacts:{len(artifacts)}"
-        )
-        att_id = self._create_attestation(CANON_WORK_DELIVERY, claim)
-        
-        delivery = WorkDelivery(
-            delivery_id=delivery_id,
-            contract_id=contract_id,
-            description=description,
-            hours_worked=hours_worked,
-            artifacts=artifacts,
-            attestation_id=att_id
+        att_ids = self._create_attestations(CANON_WORK_DELIVERY, claims, base_ns)
+        deliveries = [
+            WorkDelivery(
+                delivery_id=delivery_id,
+                contract_id=contract_id,
+                description=description,
+                hours_worked=hours_worked,
+                artifacts=artifacts,
+                attestation_id=att_id
+            )
+            for (description, hours_worked, artifacts), delivery_id, att_id
+            in zip(work_items, delivery_ids, att_ids)
+        ]
+        self.deliveries.extend(deliveries)
+        self._deliveries_by_contract.setdefault(contract_id, []).extend(deliveries)
+        for delivery in deliveries:
+            self._delivery_contracts[delivery.delivery_id] = contract_id
+        self._hours_by_contract[contract_id] = (
+            self._hours_by_contract.get(contract_id, 0)
+            + sum(delivery.hours_worked for delivery in deliveries)
         )
-        self.deliveries.append(delivery)
-        return delivery
+        return deliveries
     
     # =========================================================================
     # PEER REVIEW (Solving "Information Asymmetry")
@@ -270,7 +397,7 @@ class EmploymentZone:
     
     def submit_peer_review(
         self,
-        delivery_id: str,
+        delivery_id: bytes,
         reviewer: Employee,
         rating: int,
         feedback: str
@@ -279,15 +406,16 @@ class EmploymentZone:
         Peer review of work delivery.
         Solves information asymmetry - colleagues verify work quality.
         """
-        review_id = hashlib.sha256(
-            f"{delivery_id}:{reviewer.employee_id}:{time.time()}".encode()
-        ).hexdigest()
+        now_ns = time.time_ns()
+        review_id = self._derive_id(
+            ID_REVIEW, delivery_id, reviewer.employee_id, now_ns
+        )
         
         claim = (
-            f"REVIEW|{review_id}|delivery:{delivery_id[:8]}|"
+            f"REVIEW|{review_id.hex()}|delivery:{delivery_id[:4].hex()}|"
             f"reviewer:{reviewer.name}|rating:{rating}/5"
         )
-        att_id = self._create_attestation(CANON_PEER_REVIEW, claim)
+        att_id = self._create_attestation(CANON_PEER_REVIEW, claim, now_ns)
         
         review = PeerReview(
             review_id=review_id,
@@ -298,6 +426,12 @@ class EmploymentZone:
             attestation_id=att_id
         )
         self.reviews.append(review)
+        self._reviews_by_delivery.setdefault(delivery_id, []).append(review)
+        contract_id = self._delivery_contracts.get(delivery_id)
+        if contract_id is not None:
+            stats = self._ratings_by_contract.setdefault(contract_id, [0, 0])
+            stats[0] += rating
+            stats[1] += 1
         return review
     
     # =========================================================================
@@ -306,26 +440,28 @@ class EmploymentZone:
     
     def complete_milestone(
         self,
-        contract_id: str,
+        contract_id: bytes,
         milestone_name: str,
-        delivery_ids: List[str],
-        review_ids: List[str],
+        delivery_ids: List[bytes],
+        review_ids: List[bytes],
         employer_approved: bool
     ) -> MilestoneCompletion:
         """
         Complete a milestone with multi-party verification.
         Requires: work deliveries + peer reviews + employer approval.
         """
-        milestone_id = hashlib.sha256(
-            f"{contract_id}:{milestone_name}:{time.time()}".encode()
-        ).hexdigest()
+        now_ns = time.time_ns()
+        milestone_id = self._derive_id(
+            ID_MILESTONE, contract_id,
+            hashlib.sha256(milestone_name.encode()).digest(), now_ns
+        )
         
         claim = (
-            f"MILESTONE|{milestone_id}|{milestone_name}|"
+            f"MILESTONE|{milestone_id.hex()}|{milestone_name}|"
             f"deliveries:{len(delivery_ids)}|reviews:{len(review_ids)}|"
             f"approved:{employer_approved}"
         )
-        att_id = self._create_attestation(CANON_MILESTONE, claim)
+        att_id = self._create_attestation(CANON_MILESTONE, claim, now_ns)
         
         milestone = MilestoneCompletion(
             milestone_id=milestone_id,
@@ -337,6 +473,7 @@ class EmploymentZone:
             attestation_id=att_id
         )
         self.milestones.append(milestone)
+        self._milestones_by_contract.setdefault(contract_id, []).append(milestone)
         return milestone
     
     # =========================================================================
@@ -345,29 +482,39 @@ class EmploymentZone:
     
     def record_payment(
         self,
-        contract_id: str,
+        contract_id: bytes,
         amount: float,
-        milestone_id: Optional[str] = None
-    ) -> dict:
+        milestone_id: Optional[bytes] = None
+    ) -> Payment:
         """Record payment against contract or milestone."""
-        payment_id = hashlib.sha256(
-            f"PAYMENT:{contract_id}:{amount}:{time.time()}".encode()
-        ).hexdigest()
+        contract = self.contracts.get(contract_id)
+        if contract is None:
+            raise ValueError("Contract not found")
+        
+        now_ns = time.time_ns()
+        payment_id = self._derive_id(
+            ID_PAYMENT, contract_id,
+            hashlib.sha256(repr(amount).encode()).digest(), now_ns
+        )
         
         claim = (
-            f"PAYMENT|{payment_id}|contract:{contract_id[:8]}|"
-            f"amount:{amount}|milestone:{milestone_id[:8] if milestone_id else 'N/A'}"
+            f"PAYMENT|{payment_id.hex()}|contract:{contract.short_id}|"
+            f"amount:{amount}|milestone:{milestone_id[:4].hex() if milestone_id else 'N/A'}"
         )
-        att_id = self._create_attestation(CANON_PAYMENT, claim)
+        att_id = self._create_attestation(CANON_PAYMENT, claim, now_ns)
         
-        payment = {
-            "payment_id": payment_id,
-            "contract_id": contract_id,
-            "amount": amount,
-            "milestone_id": milestone_id,
-            "attestation_id": att_id
-        }
+        payment = Payment(
+            payment_id=payment_id,
+            contract_id=contract_id,
+            amount=amount,
+            milestone_id=milestone_id,
+            attestation_id=att_id
+        )
         self.payments.append(payment)
+        self._payments_by_contract.setdefault(contract_id, []).append(payment)
+        self._paid_by_contract[contract_id] = (
+            self._paid_by_contract.get(contract_id, 0) + amount
+        )
         return payment
     
     # =========================================================================
@@ -376,26 +523,34 @@ class EmploymentZone:
     
     def file_dispute(
         self,
-        contract_id: str,
-        filed_by: str,
+        contract_id: bytes,
+        filed_by: bytes,
         reason: str
-    ) -> dict:
+    ) -> Dispute:
         """File a dispute on the contract."""
-        dispute_id = hashlib.sha256(
-            f"DISPUTE:{contract_id}:{reason}:{time.time()}".encode()
-        ).hexdigest()
+        contract = self.contracts.get(contract_id)
+        if contract is None:
+            raise ValueError("Contract not found")
         
-        claim = f"DISPUTE|{dispute_id}|contract:{contract_id[:8]}|by:{filed_by[:8]}"
-        att_id = self._create_attestation(CANON_DISPUTE, claim)
+        now_ns = time.time_ns()
+        dispute_id = self._derive_id(
+            ID_DISPUTE, contract_id,
+            hashlib.sha256(reason.encode()).digest(), now_ns
+        )
         
-        dispute = {
-            "dispute_id": dispute_id,
-            "contract_id": contract_id,
-            "filed_by": filed_by,
-            "reason": reason,
-            "attestation_id": att_id,
-            "status": "OPEN"
-        }
+        claim = (
+            f"DISPUTE|{dispute_id.hex()}|contract:{contract.short_id}|"
+            f"by:{filed_by[:4].hex()}"
+        )
+        att_id = self._create_attestation(CANON_DISPUTE, claim, now_ns)
+        
+        dispute = Dispute(
+            dispute_id=dispute_id,
+            contract_id=contract_id,
+            filed_by=filed_by,
+            reason=reason,
+            attestation_id=att_id
+        )
         self.disputes.append(dispute)
         return dispute
     
@@ -403,17 +558,21 @@ class EmploymentZone:
     # VERIFICATION
     # =========================================================================
     
-    def get_work_history(self, contract_id: str) -> dict:
+    def get_work_history(self, contract_id: bytes) -> dict:
         """Get complete verifiable work history for a contract."""
         contract = self.contracts.get(contract_id)
         if not contract:
             return {}
         
-        deliveries = [d for d in self.deliveries if d.contract_id == contract_id]
-        delivery_ids = [d.delivery_id for d in deliveries]
-        reviews = [r for r in self.reviews if r.delivery_id in delivery_ids]
-        milestones = [m for m in self.milestones if m.contract_id == contract_id]
-        payments = [p for p in self.payments if p["contract_id"] == contract_id]
+        deliveries = list(self._deliveries_by_contract.get(contract_id, ()))
+        reviews = [
+            r
+            for d in deliveries
+            for r in self._reviews_by_delivery.get(d.delivery_id, ())
+        ]
+        milestones = list(self._milestones_by_contract.get(contract_id, ()))
+        payments = list(self._payments_by_contract.get(contract_id, ()))
+        rating_sum, review_count = self._ratings_by_contract.get(contract_id, (0, 0))
         
         return {
             "contract": contract,
@@ -421,9 +580,9 @@ class EmploymentZone:
             "reviews": reviews,
             "milestones": milestones,
             "payments": payments,
-            "total_hours": sum(d.hours_worked for d in deliveries),
-            "avg_rating": sum(r.rating for r in reviews) / len(reviews) if reviews else 0,
-            "total_paid": sum(p["amount"] for p in payments)
+            "total_hours": self._hours_by_contract.get(contract_id, 0),
+            "avg_rating": rating_sum / review_count if review_count else 0,
+            "total_paid": self._paid_by_contract.get(contract_id, 0)
         }
 
 
@@ -431,7 +590,22 @@ class EmploymentZone:
 # DEMO
 # =============================================================================
 
-def main():
+def main(quiet: bool = False):
+    """
+    Run the demo. Its report is buffered and written out in one go at the
+    end (also if the demo fails), so console I/O stays out of the
+    attestation path.
+    """
+    report = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(report):
+            run_demo()
+    finally:
+        if not quiet:
+            sys.stdout.write(report.getvalue())
+
+
+def run_demo():
     print("=" * 80)
     print("CONTRACT COMPLETION POC - EMPLOYMENT VERIFICATION")
     print("Implementing Hart & Holmström's Contract Theory (Nobel 2016)")
@@ -442,7 +616,7 @@ def main():
     zone = EmploymentZone("Tech Talent Network")
     
     print(f"\n[ZONE] Created: {zone.zone_name}")
-    print(f"   Zone ID: {zone.zone_id[:16]}...")
+    print(f"   Zone ID: {zone.zone_id[:8].hex()}...")
     
     # =========================================================================
     # SETUP: Register parties
@@ -485,12 +659,12 @@ def main():
         ]
     )
     
-    print(f"\n   [CONTRACT] {contract.contract_id[:16]}...")
+    print(f"\n   [CONTRACT] {contract.contract_id[:8].hex()}...")
     print(f"   Employer: {employer.company_name}")
     print(f"   Employee: {employee.name}")
     print(f"   Salary: ${contract.monthly_salary:,}/month")
     print(f"   Milestones: {len(contract.milestones)}")
-    print(f"   Attestation: {contract.attestation_id[:16]}...")
+    print(f"   Attestation: {contract.attestation_id[:8].hex()}...")
     print(f"\n   NOTE: Contract is INCOMPLETE - details handled via attestations")
     
     # =========================================================================
@@ -500,7 +674,6 @@ def main():
     print("STEP 3: Work Delivery (Solving 'Unverifiable Effort')")
     print("=" * 80)
     
-    deliveries = []
     work_items = [
         ("System architecture document completed", 16, ["arch_doc_v1.pdf"]),
         ("Database schema designed", 8, ["schema.sql", "erd.png"]),
@@ -508,17 +681,11 @@ def main():
         ("Frontend integration", 24, ["frontend.js", "styles.css"]),
     ]
     
-    for desc, hours, artifacts in work_items:
-        delivery = zone.submit_work(
-            contract.contract_id,
-            desc,
-            hours,
-            artifacts
-        )
-        deliveries.append(delivery)
+    deliveries = zone.submit_work_batch(contract.contract_id, work_items)
+    for (desc, hours, artifacts), delivery in zip(work_items, deliveries):
         print(f"   [WORK] {desc}")
         print(f"          Hours: {hours} | Artifacts: {artifacts}")
-        print(f"          Attestation: {delivery.attestation_id[:16]}...")
+        print(f"          Attestation: {delivery.attestation_id[:8].hex()}...")
     
     # =========================================================================
     # PEER REVIEW: Solve "Information Asymmetry"
@@ -538,8 +705,8 @@ def main():
             feedback="Excellent work, well documented"
         )
         reviews.append(review)
-        print(f"   [REVIEW] {peer1.name} reviewed delivery {delivery.delivery_id[:8]}...")
-        print(f"            Rating: {review.rating}/5 | Attestation: {review.attestation_id[:16]}...")
+        print(f"   [REVIEW] {peer1.name} reviewed delivery {delivery.delivery_id[:4].hex()}...")
+        print(f"            Rating: {review.rating}/5 | Attestation: {review.attestation_id[:8].hex()}...")
     
     # Peer 2 reviews last 2 deliveries
     for delivery in deliveries[2:]:
@@ -550,8 +717,8 @@ def main():
             feedback="Good quality, minor improvements suggested"
         )
         reviews.append(review)
-        print(f"   [REVIEW] {peer2.name} reviewed delivery {delivery.delivery_id[:8]}...")
-        print(f"            Rating: {review.rating}/5 | Attestation: {review.attestation_id[:16]}...")
+        print(f"   [REVIEW] {peer2.name} reviewed delivery {delivery.delivery_id[:4].hex()}...")
+        print(f"            Rating: {review.rating}/5 | Attestation: {review.attestation_id[:8].hex()}...")
     
     # =========================================================================
     # MILESTONE: Multi-party Verification
@@ -572,7 +739,7 @@ def main():
     print(f"   Deliveries: {len(milestone.completed_deliveries)}")
     print(f"   Reviews: {len(milestone.peer_reviews)}")
     print(f"   Employer approved: {'✅ Yes' if milestone.employer_approved else '❌ No'}")
-    print(f"   Attestation: {milestone.attestation_id[:16]}...")
+    print(f"   Attestation: {milestone.attestation_id[:8].hex()}...")
     
     # =========================================================================
     # PAYMENT: Attestation-based Claims
@@ -587,10 +754,10 @@ def main():
         milestone_id=milestone.milestone_id
     )
     
-    print(f"   [PAYMENT] ${payment['amount']:,}")
-    print(f"   Contract: {payment['contract_id'][:16]}...")
-    print(f"   Milestone: {payment['milestone_id'][:16]}...")
-    print(f"   Attestation: {payment['attestation_id'][:16]}...")
+    print(f"   [PAYMENT] ${payment.amount:,}")
+    print(f"   Contract: {payment.contract_id[:8].hex()}...")
+    print(f"   Milestone: {payment.milestone_id[:8].hex()}...")
+    print(f"   Attestation: {payment.attestation_id[:8].hex()}...")
     
     # =========================================================================
     # VERIFICATION: Complete Work History
@@ -601,7 +768,7 @@ def main():
     
     history = zone.get_work_history(contract.contract_id)
     
-    print(f"\n   [HISTORY] Contract {contract.contract_id[:16]}...")
+    print(f"\n   [HISTORY] Contract {contract.contract_id[:8].hex()}...")
     print(f"   Total hours worked: {history['total_hours']}")
     print(f"   Average rating: {history['avg_rating']:.1f}/5")
     print(f"   Total paid: ${history['total_paid']:,}")
@@ -617,11 +784,11 @@ def main():
     print("=" * 80)
     
     root = zone.merkle.compute_root()
-    proof = zone.merkle.generate_proof(contract.attestation_id)
+    proof = zone.merkle.generate_proof(contract.attestation_id.hex())
     
     if proof:
         is_valid = MerkleEngine.verify_proof(
-            contract.attestation_id,
+            contract.attestation_id.hex(),
             proof['leaf_index'],
             proof['proof'],
             root
@@ -658,4 +825,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Glogos employment verification demo")
+    parser.add_argument("--quiet", action="store_true", help="Suppress the demo report")
+    main(quiet=parser.parse_args().quiet)
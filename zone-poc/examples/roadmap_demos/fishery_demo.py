@@ -47,18 +47,18 @@ from zone.merkle import MerkleEngine
 
 GLSR = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
-# Canon IDs for fishery management
-CANON_FISHER_MEMBERSHIP = hashlib.sha256(b"fishery:membership:1.0").hexdigest()
-CANON_CATCH_REPORT = hashlib.sha256(b"fishery:catch-report:1.0").hexdigest()
-CANON_QUOTA_ALLOCATION = hashlib.sha256(b"fishery:quota:1.0").hexdigest()
-CANON_GOVERNANCE_VOTE = hashlib.sha256(b"fishery:governance:1.0").hexdigest()
-CANON_SANCTION = hashlib.sha256(b"fishery:sanction:1.0").hexdigest()
+# Canon IDs for fishery management (raw 32-byte digests)
+CANON_FISHER_MEMBERSHIP = hashlib.sha256(b"fishery:membership:1.0").digest()
+CANON_CATCH_REPORT = hashlib.sha256(b"fishery:catch-report:1.0").digest()
+CANON_QUOTA_ALLOCATION = hashlib.sha256(b"fishery:quota:1.0").digest()
+CANON_GOVERNANCE_VOTE = hashlib.sha256(b"fishery:governance:1.0").digest()
+CANON_SANCTION = hashlib.sha256(b"fishery:sanction:1.0").digest()
 
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Fisher:
     """A fisher in the commons"""
     fisher_id: str
@@ -69,7 +69,7 @@ class Fisher:
     total_catch_kg: float = 0.0
     quota_remaining_kg: float = 0.0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CatchReport:
     """A verified catch report"""
     report_id: str
@@ -80,7 +80,7 @@ class CatchReport:
     timestamp: int
     witnesses: List[str] = field(default_factory=list)  # Peer attestation
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuotaAllocation:
     """Annual quota allocation"""
     allocation_id: str
@@ -89,7 +89,7 @@ class QuotaAllocation:
     period: str  # e.g., "2025-Q1"
     governance_vote_id: str  # Reference to vote that approved
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GovernanceVote:
     """Collective governance decision"""
     vote_id: str
@@ -109,7 +109,8 @@ class FisheryZone:
     """
     
     def __init__(self, zone_name: str, total_sustainable_catch_kg: float):
-        self.zone_id = hashlib.sha256(zone_name.encode()).hexdigest()
+        self._zone_id_bytes = hashlib.sha256(zone_name.encode()).digest()
+        self.zone_id = self._zone_id_bytes.hex()
         self.zone_name = zone_name
         self.total_sustainable_catch_kg = total_sustainable_catch_kg
         self.merkle = MerkleEngine()
@@ -121,24 +122,38 @@ class FisheryZone:
         self.votes: List[GovernanceVote] = []
         self.sanctions: List[dict] = []
         
-        # Attestations
-        self.attestation_ids: List[str] = []
+        # All attestation IDs in creation order, packed as 32-byte digests
+        self._attestation_digests = bytearray()
+        self._prefix_cache: Dict[bytes, bytes] = {}  # canon_id -> zone_id || canon_id
         
-    def _create_attestation(self, canon_id: str, claim: str) -> str:
+    def _create_attestation(self, canon_id: bytes, claim: str) -> str:
         """Create attestation ID per Spec §3.3"""
         timestamp = int(time.time())
-        claim_hash = hashlib.sha256(claim.encode()).hexdigest()
+        claim_hash = hashlib.sha256(claim.encode()).digest()
+        prefix = self._prefix_cache.get(canon_id)
+        if prefix is None:
+            prefix = self._zone_id_bytes + canon_id
+            self._prefix_cache[canon_id] = prefix
         preimage = (
-            bytes.fromhex(self.zone_id) +
-            bytes.fromhex(canon_id) +
-            bytes.fromhex(claim_hash) +
+            prefix +
+            claim_hash +
             timestamp.to_bytes(8, 'big')
         )
-        att_id = hashlib.sha256(preimage).hexdigest()
-        self.attestation_ids.append(att_id)
+        digest = hashlib.sha256(preimage).digest()
+        self._attestation_digests += digest
+        att_id = digest.hex()
         self.merkle.add_leaf(att_id)
         return att_id
     
+    @property
+    def attestation_count(self) -> int:
+        """Number of attestations created by this zone"""
+        return len(self._attestation_digests) // 32
+    
+    def attestation_id_at(self, index: int) -> str:
+        """Attestation ID by creation order, as hex"""
+        return self._attestation_digests[32 * index:32 * (index + 1)].hex()
+    
     # =========================================================================
     # PRINCIPLE 1: Clear Boundaries (Membership)
     # =========================================================================
@@ -287,13 +302,13 @@ class FisheryZone:
             return None
         
         fisher = self.fishers[fisher_id]
-        self.merkle.compute_root()
+        root = self.merkle.compute_root()
         proof = self.merkle.generate_proof(fisher.membership_attestation)
         
         return {
             "fisher": fisher,
             "proof": proof,
-            "merkle_root": self.merkle.compute_root()
+            "merkle_root": root
         }
     
     def get_catch_history(self, fisher_id: str) -> List[CatchReport]:
@@ -306,14 +321,15 @@ class FisheryZone:
     
     def get_zone_state(self) -> dict:
         """Get full zone state for federation"""
+        total_catch_kg = sum(f.total_catch_kg for f in self.fishers.values())
         return {
             "zone_id": self.zone_id,
             "zone_name": self.zone_name,
             "merkle_root": self.merkle.compute_root(),
             "total_fishers": len(self.fishers),
-            "total_catch_kg": sum(f.total_catch_kg for f in self.fishers.values()),
+            "total_catch_kg": total_catch_kg,
             "sustainable_limit_kg": self.total_sustainable_catch_kg,
-            "utilization": sum(f.total_catch_kg for f in self.fishers.values()) / self.total_sustainable_catch_kg * 100
+            "utilization": total_catch_kg / self.total_sustainable_catch_kg * 100
         }
 
 
@@ -484,7 +500,7 @@ def main():
         print(f"   {status} {principle}")
         print(f"      └── {implementation}")
     
-    print(f"\n   Total attestations: {len(zone.attestation_ids)}")
+    print(f"\n   Total attestations: {zone.attestation_count}")
     print(f"   Merkle root: {zone.merkle.compute_root()[:16]}...")
     print("=" * 80)
     print("Commons governance POC complete!")
@@ -12,12 +12,22 @@ GLSR = SHA256("") = e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852
 The simplest possible genesis - SHA256 of empty string.
 
 ⚠️  WARNING: This test will take 30-60 seconds and use ~300MB RAM
+
+Usage:
+    cd zone-poc
+    python tests/benchmark_10m.py
+
+The script is standard-library only, so it also runs unchanged under
+PyPy (pypy3 tests/benchmark_10m.py), whose JIT removes most of the
+interpreter overhead in the generation and tree-building loops.
 """
 
 import hashlib
+import os
 import time
 import statistics
 import gc
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List, Tuple
 
 # =============================================================================
@@ -28,217 +38,282 @@ GLSR = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"  # SHA
 ZONE_ID = hashlib.sha256(b"high-throughput-zone-v1").hexdigest()
 CANON_ID = hashlib.sha256(b"timestamp:1.0").hexdigest()
 
-print("=" * 80)
-print("🔥 GLOGOS ULTIMATE STRESS TEST - 10 MILLION ATTESTATIONS 🔥")
-print("=" * 80)
-print(f"\nGLSR: {GLSR}")
-print(f"Zone ID:  {ZONE_ID}")
-print(f"Canon ID: {CANON_ID}")
-print("\n⚠️  ULTIMATE TEST - This will push the absolute limits!")
-print("   Expected duration: 30-60 seconds")
-print("   Memory usage: ~300MB")
-print("   Testing: 10,000,000 attestations with GLSR anchoring\n")
+# zone_id || canon_id is the same for every attestation: decode it once.
+# hashlib is OpenSSL-backed and already uses SHA-NI where the CPU has it.
+ZC_PREFIX = bytes.fromhex(ZONE_ID) + bytes.fromhex(CANON_ID)
+
+BATCH_SIZE = 500000  # Process in batches of 500K for efficiency
+TOTAL = 10000000
 
 # =============================================================================
 # OPTIMIZED HELPER FUNCTIONS
 # =============================================================================
 
-def create_attestation_id(claim_num: int, timestamp: int) -> str:
-    """Optimized attestation ID creation (no full dict)"""
+def create_attestation_id(claim_num: int, timestamp: int) -> bytes:
+    """Optimized attestation ID creation (no full dict), as a raw 32-byte digest"""
     # Inline claim hash computation
-    claim_hash = hashlib.sha256(f"ultimate_claim_{claim_num}".encode()).hexdigest()
+    # bytes %-formatting skips building a str and re-encoding it
+    claim_hash = hashlib.sha256(b"ultimate_claim_%d" % claim_num).digest()
     
     # attestation_id = SHA256(zone_id || canon_id || claim_hash || timestamp_bytes)
     timestamp_bytes = timestamp.to_bytes(8, byteorder='big')
-    preimage = bytes.fromhex(ZONE_ID) + bytes.fromhex(CANON_ID) + bytes.fromhex(claim_hash) + timestamp_bytes
-    return hashlib.sha256(preimage).hexdigest()
+    preimage = ZC_PREFIX + claim_hash + timestamp_bytes
+    return hashlib.sha256(preimage).digest()
+
+def generate_batch(batch_num: int, batch_size: int, base_timestamp: int) -> Tuple[bytes, float]:
+    """
+    Worker: create one batch of attestation IDs.
+    Returns the digests packed back to back and the batch time in ms.
+    """
+    batch_start = time.perf_counter()
+    first = batch_num * batch_size
+    # Optimized: Generate IDs without full attestation objects
+    batch_bytes = b"".join([
+        create_attestation_id(idx, base_timestamp + idx)
+        for idx in range(first, first + batch_size)
+    ])
+    return batch_bytes, (time.perf_counter() - batch_start) * 1000
+
+MERKLE_BLOCK = 8192  # Leaves per cache-resident subtree (256 KiB of digests)
+
+def reduce_level_in_place(level: List[bytes]) -> bytes:
+    """Reduce a list of digests to its Merkle root, reusing the list"""
+    # Parent i overwrites slot i, which has already been read, and the
+    # tail is trimmed per level
+    sha256 = hashlib.sha256
+    n = len(level)
+    
+    while n > 1:
+        if n & 1:
+            # Odd count: duplicate last node (Spec §4.4)
+            level.append(level[n - 1])
+            n += 1
+        for i in range(0, n, 2):
+            level[i >> 1] = sha256(level[i] + level[i + 1]).digest()
+        
+        n >>= 1
+        del level[n:]
+    
+    return level[0]
 
-def build_merkle_tree_fast(leaves: List[str]) -> Tuple[str, int]:
-    """Optimized Merkle tree builder"""
+def build_merkle_tree_fast(leaves: List[bytes]) -> Tuple[str, int]:
+    """
+    Optimized Merkle tree builder over raw digests; returns the hex root.
+    Sorts `leaves` in place (a no-op pass if they are already sorted).
+    """
     if not leaves:
         return hashlib.sha256(b"").hexdigest(), 0
     
-    current_level = sorted(leaves)
-    height = 0
+    leaves.sort()
+    sorted_leaves = leaves
+    height = (len(sorted_leaves) - 1).bit_length()
+    if len(sorted_leaves) <= MERKLE_BLOCK:
+        return reduce_level_in_place(sorted_leaves).hex(), height
     
-    while len(current_level) > 1:
-        next_level = []
-        for i in range(0, len(current_level), 2):
-            left = current_level[i]
-            right = current_level[i + 1] if i + 1 < len(current_level) else left
-            
-            node_hash = hashlib.sha256(
-                bytes.fromhex(left) + bytes.fromhex(right)
-            ).hexdigest()
-            next_level.append(node_hash)
-        
-        current_level = next_level
-        height += 1
+    # Reduce one MERKLE_BLOCK-aligned subtree at a time so its levels stay
+    # in cache, then reduce the subtree roots. A short last block is lifted
+    # to full block height by pairing its root with itself, which is what
+    # the duplicate-last rule does to it inside the full tree.
+    sha256 = hashlib.sha256
+    block_height = MERKLE_BLOCK.bit_length() - 1
+    roots = []
+    for start in range(0, len(sorted_leaves), MERKLE_BLOCK):
+        block = sorted_leaves[start:start + MERKLE_BLOCK]
+        missing_levels = block_height - (len(block) - 1).bit_length()
+        root = reduce_level_in_place(block)
+        for _ in range(missing_levels):
+            root = sha256(root + root).digest()
+        roots.append(root)
     
-    return current_level[0], height
+    return reduce_level_in_place(roots).hex(), height
 
 # =============================================================================
 # ULTIMATE TEST: 10 MILLION ATTESTATIONS
 # =============================================================================
 
-print("=" * 80)
-print("ULTIMATE TEST: 10,000,000 attestations (optimized batch processing)")
-print("=" * 80)
-
-BATCH_SIZE = 500000  # Process in batches of 500K for efficiency
-TOTAL = 10000000
-
-all_attestation_ids = []
-batch_times = []
-batch_throughputs = []
-base_timestamp = int(time.time())
-
-print(f"\nProcessing {TOTAL:,} attestations in {TOTAL//BATCH_SIZE} batches of {BATCH_SIZE:,}...\n")
-
-overall_start = time.perf_counter()
-
-for batch_num in range(TOTAL // BATCH_SIZE):
-    batch_start = time.perf_counter()
-    batch_ids = []
-    
-    print(f"Batch {batch_num + 1:2d}/{TOTAL//BATCH_SIZE}: ", end="", flush=True)
-    
-    # Optimized: Generate IDs without full attestation objects
-    for i in range(BATCH_SIZE):
-        idx = batch_num * BATCH_SIZE + i
-        attestation_id = create_attestation_id(idx, base_timestamp + idx)
-        batch_ids.append(attestation_id)
-    
-    batch_time = (time.perf_counter() - batch_start) * 1000
-    batch_throughput = BATCH_SIZE / (batch_time / 1000)
-    
-    batch_times.append(batch_time)
-    batch_throughputs.append(batch_throughput)
-    all_attestation_ids.extend(batch_ids)
+def main():
+    # The run only allocates bytes and lists of bytes, so no reference
+    # cycles are created. Move what import created out of the tracked
+    # generations and skip collection passes for the whole run.
+    if hasattr(gc, "freeze"):  # CPython only
+        gc.freeze()
+    gc.disable()
     
-    print(f"{batch_time:6.0f} ms ({batch_throughput:7.0f} ops/sec) | Total: {len(all_attestation_ids):,}")
-    
-    # Aggressive garbage collection every batch
-    gc.collect()
-
-overall_time = (time.perf_counter() - overall_start) * 1000
-
-print(f"\n{'='*80}")
-print(f"[CHART] 10 MILLION ATTESTATIONS RESULTS")
-print(f"{'='*80}")
-print(f"\n   Total attestations:  {TOTAL:,}")
-print(f"   Total time:          {overall_time:.2f} ms ({overall_time/1000:.2f} sec)")
-print(f"   Average per batch:   {statistics.mean(batch_times):.2f} ms")
-print(f"   Overall throughput:  {TOTAL/(overall_time/1000):.0f} attestations/sec")
-print(f"   Peak throughput:     {max(batch_throughputs):.0f} attestations/sec")
-print(f"   Min throughput:      {min(batch_throughputs):.0f} attestations/sec")
-print(f"   Median throughput:   {statistics.median(batch_throughputs):.0f} attestations/sec")
-
-# =============================================================================
-# MERKLE TREE CONSTRUCTION (10M leaves)
-# =============================================================================
-
-print(f"\n{'='*80}")
-print("MERKLE TREE: Building from 10,000,000 leaves")
-print(f"{'='*80}")
-
-print(f"\nSorting {len(all_attestation_ids):,} attestation IDs...")
-sort_start = time.perf_counter()
-sorted_ids = sorted(all_attestation_ids)
-sort_time = (time.perf_counter() - sort_start) * 1000
-print(f"   Sort time: {sort_time:.2f} ms ({sort_time/1000:.2f} sec)")
-
-print(f"\nBuilding Merkle tree (this may take 15-30 seconds)...")
-merkle_start = time.perf_counter()
-merkle_root, merkle_height = build_merkle_tree_fast(sorted_ids)
-merkle_time = (time.perf_counter() - merkle_start) * 1000
-
-print(f"\n[CHART] Merkle Tree Results:")
-print(f"   Leaves:      {len(all_attestation_ids):,}")
-print(f"   Root:        {merkle_root}")
-print(f"   Height:      {merkle_height} levels")
-print(f"   Build time:  {merkle_time:.2f} ms ({merkle_time/1000:.2f} sec)")
-print(f"   Proof size:  ~{merkle_height} sibling hashes per attestation")
-
-# =============================================================================
-# MEMORY & PERFORMANCE ANALYSIS
-# =============================================================================
-
-print(f"\n{'='*80}")
-print("MEMORY & PERFORMANCE ANALYSIS")
-print(f"{'='*80}")
-
-# Memory estimate
-attestation_memory_mb = (len(all_attestation_ids) * 32) / (1024 * 1024)
-print(f"\n💾 Memory Usage:")
-print(f"   Attestation IDs: ~{attestation_memory_mb:.1f} MB")
-print(f"   ({len(all_attestation_ids):,} × 32 bytes)")
-
-# Performance metrics
-avg_latency_ms = (overall_time / TOTAL)
-avg_latency_us = avg_latency_ms * 1000
-avg_latency_ns = avg_latency_us * 1000
-
-print(f"\n⚡ Per-Attestation Performance:")
-print(f"   Average latency:  {avg_latency_ms:.6f} ms")
-print(f"                     {avg_latency_us:.3f} microseconds")
-print(f"                     {avg_latency_ns:.1f} nanoseconds")
-print(f"   Throughput:       {TOTAL/(overall_time/1000):.0f} attestations/sec")
-
-print(f"\n🌲 Merkle Tree Performance:")
-print(f"   10M leaves built in {merkle_time/1000:.2f} seconds")
-print(f"   Average per leaf:   {merkle_time/len(all_attestation_ids):.6f} ms")
-print(f"   Tree efficiency:    {len(all_attestation_ids)/(merkle_time/1000):.0f} leaves/sec")
-
-# Note: glogos_tps used in summary below
-glogos_tps = TOTAL / (overall_time / 1000)
-
-# =============================================================================
-# ULTIMATE SUMMARY
-# =============================================================================
-
-print(f"\n{'='*80}")
-print("[TROPHY] ULTIMATE STRESS TEST SUMMARY [TROPHY]")
-print(f"{'='*80}")
-
-total_time_sec = overall_time / 1000
-
-print(f"\n✅ Successfully processed {TOTAL:,} attestations!")
-print(f"\n🎯 Key Achievements:")
-print(f"   1. [OK] 10 million attestations created")
-print(f"   2. [OK] {total_time_sec:.2f} seconds total time")
-print(f"   3. [OK] {glogos_tps:,.0f} sustained throughput")
-print(f"   4. [OK] {avg_latency_us:.3f} microsecond average latency")
-print(f"   5. [OK] Merkle tree: {merkle_height} levels, {merkle_time/1000:.2f} sec")
-print(f"   6. [OK] All attestations GLSR-anchored")
-
-print(f"\n[LINK] GLSR Anchoring at Scale:")
-print(f"   All {TOTAL:,} attestations anchored to:")
-print(f"   GLSR: {GLSR}")
-print(f"   Formula: SHA256('') - the simplest possible genesis")
-
-print(f"\n💪 Capabilities Proven:")
-print(f"   1. [OK] Industrial-scale attestation creation (10M)")
-print(f"   2. [OK] Sub-microsecond average latency")
-print(f"   3. [OK] Merkle tree from 10M leaves")
-print(f"   4. [OK] GLSR anchoring at massive scale")
-print(f"   5. [OK] Spec-compliant format maintained")
-print(f"   6. [OK] Memory-efficient processing (~{attestation_memory_mb:.0f}MB)")
-
-print(f"\n{'='*80}")
-print("STATUS: EXPERIMENTAL")
-print(f"{'='*80}")
-print(f"\n⚠️  This is a reference implementation, not production software.")
-print(f"\n   Demonstrated capabilities (local benchmark only):")
-print(f"   • {glogos_tps:,.0f} attestations/sec")
-print(f"   • {avg_latency_us:.3f} microsecond latency")
-print(f"   • 10M attestation scale")
-print(f"   • GLSR integration complete")
-print(f"   • Spec v1.0.0-rc.0 aligned")
-
-print(f"\n{'='*80}")
-print("MAINNET BIRTHDAY")
-print(f"{'='*80}")
-print("[WAIT] Winter Solstice: Dec 21, 2025 @ 15:03 UTC")
-print("      GLSR = SHA256('') - mathematics, not opinion")
-print(f"{'='*80}")
+    print("=" * 80)
+    print("🔥 GLOGOS ULTIMATE STRESS TEST - 10 MILLION ATTESTATIONS 🔥")
+    print("=" * 80)
+    print(f"\nGLSR: {GLSR}")
+    print(f"Zone ID:  {ZONE_ID}")
+    print(f"Canon ID: {CANON_ID}")
+    print("\n⚠️  ULTIMATE TEST - This will push the absolute limits!")
+    print("   Expected duration: 30-60 seconds")
+    print("   Memory usage: ~300MB")
+    print("   Testing: 10,000,000 attestations with GLSR anchoring\n")
+
+    print("=" * 80)
+    print("ULTIMATE TEST: 10,000,000 attestations (optimized batch processing)")
+    print("=" * 80)
+
+    # All attestation IDs packed back to back as 32-byte digests
+    attestation_buf = bytearray(TOTAL * 32)
+    attestation_count = 0
+    batch_times = []
+    batch_throughputs = []
+    base_timestamp = int(time.time())
+
+    print(f"\nProcessing {TOTAL:,} attestations in {TOTAL//BATCH_SIZE} batches of {BATCH_SIZE:,}...\n")
+
+    overall_start = time.perf_counter()
+
+    # Batches are independent: generate them on all cores and copy each
+    # worker's packed digests into the buffer at the batch's offset
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(generate_batch, batch_num, BATCH_SIZE, base_timestamp): batch_num
+            for batch_num in range(TOTAL // BATCH_SIZE)
+        }
+        for future in as_completed(futures):
+            batch_num = futures[future]
+            batch_bytes, batch_time = future.result()
+            batch_throughput = BATCH_SIZE / (batch_time / 1000)
+        
+            batch_times.append(batch_time)
+            batch_throughputs.append(batch_throughput)
+            batch_offset = batch_num * BATCH_SIZE * 32
+            attestation_buf[batch_offset:batch_offset + BATCH_SIZE * 32] = batch_bytes
+            attestation_count += BATCH_SIZE
+        
+            print(f"Batch {batch_num + 1:2d}/{TOTAL//BATCH_SIZE}: "
+                  f"{batch_time:6.0f} ms ({batch_throughput:7.0f} ops/sec) | Total: {attestation_count:,}")
+
+    overall_time = (time.perf_counter() - overall_start) * 1000
+
+    print(f"\n{'='*80}")
+    print(f"[CHART] 10 MILLION ATTESTATIONS RESULTS")
+    print(f"{'='*80}")
+    print(f"\n   Total attestations:  {TOTAL:,}")
+    print(f"   Total time:          {overall_time:.2f} ms ({overall_time/1000:.2f} sec)")
+    print(f"   Average per batch:   {statistics.mean(batch_times):.2f} ms")
+    print(f"   Overall throughput:  {TOTAL/(overall_time/1000):.0f} attestations/sec")
+    print(f"   Peak throughput:     {max(batch_throughputs):.0f} attestations/sec")
+    print(f"   Min throughput:      {min(batch_throughputs):.0f} attestations/sec")
+    print(f"   Median throughput:   {statistics.median(batch_throughputs):.0f} attestations/sec")
+
+    # =============================================================================
+    # MERKLE TREE CONSTRUCTION (10M leaves)
+    # =============================================================================
+
+    print(f"\n{'='*80}")
+    print("MERKLE TREE: Building from 10,000,000 leaves")
+    print(f"{'='*80}")
+
+    print(f"\nSorting {attestation_count:,} attestation IDs...")
+    sort_start = time.perf_counter()
+    attestation_view = memoryview(attestation_buf)
+    all_attestation_ids = [
+        attestation_view[i:i + 32].tobytes() for i in range(0, attestation_count * 32, 32)
+    ]
+    attestation_view.release()
+    all_attestation_ids.sort()
+    sorted_ids = all_attestation_ids
+    sort_time = (time.perf_counter() - sort_start) * 1000
+    print(f"   Sort time: {sort_time:.2f} ms ({sort_time/1000:.2f} sec)")
+
+    print(f"\nBuilding Merkle tree (this may take 15-30 seconds)...")
+    merkle_start = time.perf_counter()
+    merkle_root, merkle_height = build_merkle_tree_fast(sorted_ids)
+    merkle_time = (time.perf_counter() - merkle_start) * 1000
+
+    print(f"\n[CHART] Merkle Tree Results:")
+    print(f"   Leaves:      {attestation_count:,}")
+    print(f"   Root:        {merkle_root}")
+    print(f"   Height:      {merkle_height} levels")
+    print(f"   Build time:  {merkle_time:.2f} ms ({merkle_time/1000:.2f} sec)")
+    print(f"   Proof size:  ~{merkle_height} sibling hashes per attestation")
+
+    # =============================================================================
+    # MEMORY & PERFORMANCE ANALYSIS
+    # =============================================================================
+
+    print(f"\n{'='*80}")
+    print("MEMORY & PERFORMANCE ANALYSIS")
+    print(f"{'='*80}")
+
+    # Memory estimate
+    attestation_memory_mb = (attestation_count * 32) / (1024 * 1024)
+    print(f"\n💾 Memory Usage:")
+    print(f"   Attestation IDs: ~{attestation_memory_mb:.1f} MB")
+    print(f"   ({attestation_count:,} × 32 bytes)")
+
+    # Performance metrics
+    avg_latency_ms = (overall_time / TOTAL)
+    avg_latency_us = avg_latency_ms * 1000
+    avg_latency_ns = avg_latency_us * 1000
+
+    print(f"\n⚡ Per-Attestation Performance:")
+    print(f"   Average latency:  {avg_latency_ms:.6f} ms")
+    print(f"                     {avg_latency_us:.3f} microseconds")
+    print(f"                     {avg_latency_ns:.1f} nanoseconds")
+    print(f"   Throughput:       {TOTAL/(overall_time/1000):.0f} attestations/sec")
+
+    print(f"\n🌲 Merkle Tree Performance:")
+    print(f"   10M leaves built in {merkle_time/1000:.2f} seconds")
+    print(f"   Average per leaf:   {merkle_time/attestation_count:.6f} ms")
+    print(f"   Tree efficiency:    {attestation_count/(merkle_time/1000):.0f} leaves/sec")
+
+    # Note: glogos_tps used in summary below
+    glogos_tps = TOTAL / (overall_time / 1000)
+
+    # =============================================================================
+    # ULTIMATE SUMMARY
+    # =============================================================================
+
+    print(f"\n{'='*80}")
+    print("[TROPHY] ULTIMATE STRESS TEST SUMMARY [TROPHY]")
+    print(f"{'='*80}")
+
+    total_time_sec = overall_time / 1000
+
+    print(f"\n✅ Successfully processed {TOTAL:,} attestations!")
+    print(f"\n🎯 Key Achievements:")
+    print(f"   1. [OK] 10 million attestations created")
+    print(f"   2. [OK] {total_time_sec:.2f} seconds total time")
+    print(f"   3. [OK] {glogos_tps:,.0f} sustained throughput")
+    print(f"   4. [OK] {avg_latency_us:.3f} microsecond average latency")
+    print(f"   5. [OK] Merkle tree: {merkle_height} levels, {merkle_time/1000:.2f} sec")
+    print(f"   6. [OK] All attestations GLSR-anchored")
+
+    print(f"\n[LINK] GLSR Anchoring at Scale:")
+    print(f"   All {TOTAL:,} attestations anchored to:")
+    print(f"   GLSR: {GLSR}")
+    print(f"   Formula: SHA256('') - the simplest possible genesis")
+
+    print(f"\n💪 Capabilities Proven:")
+    print(f"   1. [OK] Industrial-scale attestation creation (10M)")
+    print(f"   2. [OK] Sub-microsecond average latency")
+    print(f"   3. [OK] Merkle tree from 10M leaves")
+    print(f"   4. [OK] GLSR anchoring at massive scale")
+    print(f"   5. [OK] Spec-compliant format maintained")
+    print(f"   6. [OK] Memory-efficient processing (~{attestation_memory_mb:.0f}MB)")
+
+    print(f"\n{'='*80}")
+    print("STATUS: EXPERIMENTAL")
+    print(f"{'='*80}")
+    print(f"\n⚠️  This is a reference implementation, not production software.")
+    print(f"\n   Demonstrated capabilities (local benchmark only):")
+    print(f"   • {glogos_tps:,.0f} attestations/sec")
+    print(f"   • {avg_latency_us:.3f} microsecond latency")
+    print(f"   • 10M attestation scale")
+    print(f"   • GLSR integration complete")
+    print(f"   • Spec v1.0.0-rc.0 aligned")
+
+    print(f"\n{'='*80}")
+    print("MAINNET BIRTHDAY")
+    print(f"{'='*80}")
+    print("[WAIT] Winter Solstice: Dec 21, 2025 @ 15:03 UTC")
+    print("      GLSR = SHA256('') - mathematics, not opinion")
+    print(f"{'='*80}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,14 +13,16 @@ Usage:
     python test_api.py
 """
 
+import asyncio
+import http.client
 import subprocess
 import sys
 import time
-import json
 import urllib.request
 import urllib.parse
-import threading
-from queue import Queue
+
+import httpx
+import orjson
 
 BASE_URL = "http://127.0.0.1:8000"
 
@@ -38,65 +40,75 @@ def wait_for_server(max_wait=10):
             time.sleep(0.5)
     return False
 
+_conn = None
+
+def _connection():
+    """Return the shared keep-alive connection to the server"""
+    global _conn
+    if _conn is None:
+        url = urllib.parse.urlsplit(BASE_URL)
+        _conn = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+    return _conn
+
 def make_request(method, endpoint, data=None):
     """Make HTTP request and return JSON response"""
-    url = f"{BASE_URL}{endpoint}"
-    
+    headers = {}
+    body = None
     if data:
-        data = json.dumps(data).encode('utf-8')
-        req = urllib.request.Request(url, data=data, method=method)
-        req.add_header('Content-Type', 'application/json')
-    else:
-        req = urllib.request.Request(url, method=method)
-    
-    try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        body = e.read().decode()
-        print(f"   HTTP Error {e.code}: {body[:200]}")
+        body = orjson.dumps(data)
+        headers['Content-Type'] = 'application/json'
+
+    for attempt in range(2):
+        conn = _connection()
+        try:
+            conn.request(method, endpoint, body, headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionError):
+            # Server closed the idle connection; reconnect once
+            conn.close()
+            if attempt:
+                raise
+
+    if resp.status >= 400:
+        print(f"   HTTP Error {resp.status}: {payload.decode()[:200]}")
         return None
+    return orjson.loads(payload)
 
-def stress_worker(q: Queue, results: list):
-    """Worker thread for stress test"""
-    while not q.empty():
+async def stress_worker(client: httpx.AsyncClient, sem: asyncio.Semaphore, request_data: dict, results: list):
+    """Send one /verify request once a concurrency slot is free"""
+    async with sem:
         try:
-            request_data = q.get_nowait()
             start_time = time.perf_counter()
-            result = make_request("POST", "/verify", request_data)
+            resp = await client.post("/verify", json=request_data)
             end_time = time.perf_counter()
-            if result and 'attestation' in result:
+            if resp.status_code == 200 and 'attestation' in orjson.loads(resp.content):
                 results.append(end_time - start_time)
-            q.task_done()
-        except Exception:
-            q.task_done()
-            continue
-
-def run_stress_test(num_requests=100, concurrency=10):
-    """Runs a stress test against the /verify endpoint."""
-    print(f"\n[5] STRESS TEST ({num_requests} requests, {concurrency} concurrent)...")
-    
-    q = Queue()
-    for i in range(num_requests):
-        q.put({"claim": f"Stress test claim {i}", "evidence": "evidence"})
+        except httpx.HTTPError:
+            pass
 
+async def run_stress_test_async(num_requests: int, concurrency: int):
+    """Fire all requests over one keep-alive connection pool"""
     latencies = []
-    threads = []
-    
-    start_total_time = time.perf_counter()
-
-    for _ in range(concurrency):
-        t = threading.Thread(target=stress_worker, args=(q, latencies))
-        t.start()
-        threads.append(t)
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
 
-    for t in threads:
-        t.join()
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits, timeout=10) as client:
+        start_total_time = time.perf_counter()
+        await asyncio.gather(*(
+            stress_worker(client, sem, {"claim": f"Stress test claim {i}", "evidence": "evidence"}, latencies)
+            for i in range(num_requests)
+        ))
+        total_time = time.perf_counter() - start_total_time
 
-    total_time = time.perf_counter() - start_total_time
-    
     return total_time, latencies
 
+def run_stress_test(num_requests=100, concurrency=10):
+    """Runs a stress test against the /verify endpoint."""
+    print(f"\n[5] STRESS TEST ({num_requests} requests, {concurrency} concurrent)...")
+    return asyncio.run(run_stress_test_async(num_requests, concurrency))
+
 def main():
     print("=" * 60)
     print("  GLOGOS API TEST")
@@ -87,13 +87,9 @@ def main():
     merkle = MerkleEngine()
     
     # Add multiple attestations for realistic tree
-    attestation_ids = [attestation_id]
-    for i in range(4):
-        aid = compute_hash(f"additional_attestation_{i}")
-        attestation_ids.append(aid)
-        merkle.add_leaf(aid)
-    
-    merkle.add_leaf(attestation_id)
+    additional_ids = [compute_hash(f"additional_attestation_{i}") for i in range(4)]
+    attestation_ids = [attestation_id] + additional_ids
+    merkle.add_leaves(additional_ids + [attestation_id])
     
     root = merkle.compute_root()
     print(f"    Leaf count:  {merkle.leaf_count}")
@@ -118,6 +114,20 @@ def main():
     print(f"    Valid: {proof_valid}")
     print()
     
+    # 9. Root and proofs for several attestations in one pass
+    print("[9] Batch proofs (compute_root_and_proofs)...")
+    batch_root, batch_proofs = merkle.compute_root_and_proofs(attestation_ids + ["00" * 32])
+    batch_valid = (
+        batch_root == root
+        and batch_proofs[-1] is None
+        and all(
+            MerkleEngine.verify_proof(p['leaf_hash'], p['leaf_index'], p['proof'], batch_root)
+            for p in batch_proofs[:-1]
+        )
+    )
+    print(f"    Proofs: {len(batch_proofs) - 1} valid, 1 unknown ID -> None: {batch_valid}")
+    print()
+    
     # Summary
     print("=" * 60)
     print("  TEST COMPLETE")
@@ -129,6 +139,7 @@ Results:
   [OK] Signature: {'VALID' if is_valid else 'INVALID'}
   [OK] Merkle root: {root[:16]}...
   [OK] Proof: {'VALID' if proof_valid else 'INVALID'}
+  [OK] Batch proofs: {'VALID' if batch_valid else 'INVALID'}
 
 Full Attestation:
 {{
@@ -142,7 +153,7 @@ Full Attestation:
 }}
 """)
     
-    return is_valid and proof_valid
+    return is_valid and proof_valid and batch_valid
 
 if __name__ == "__main__":
     success = main()
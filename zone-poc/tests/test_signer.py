@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Signer checks for Glogos Zone Reference
+Covers SignedAttestation verification and verify_many.
+
+Usage:
+    cd zone-poc
+    python -m tests.test_signer
+"""
+
+import sys
+import os
+
+# Add parent to path for zone import
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from zone.signer import SigningService, compute_hash, CANON_IDS
+from zone.models import SignedAttestation
+
+
+def _signed_attestation(signer: SigningService, claim: str, citations: list) -> SignedAttestation:
+    """Sign a test attestation with this signer"""
+    canon_id = CANON_IDS["timestamp:1.0"]
+    claim_hash = compute_hash(claim)
+    evidence_hash = compute_hash("evidence for " + claim)
+    timestamp = 1733558400
+    attestation_id = signer.compute_attestation_id(canon_id, claim_hash, timestamp)
+    return SignedAttestation(
+        attestation_id=attestation_id,
+        zone_id=signer.zone_id,
+        canon_id=canon_id,
+        claim_hash=claim_hash,
+        evidence_hash=evidence_hash,
+        citations=citations,
+        timestamp=timestamp,
+        signature=signer.sign_attestation(
+            attestation_id, claim_hash, evidence_hash, timestamp, citations
+        )
+    )
+
+
+def check(results: list, name: str, ok: bool) -> None:
+    print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+    results.append(ok)
+
+
+def main():
+    print("=" * 60)
+    print("  GLOGOS SIGNER TEST")
+    print("=" * 60)
+    
+    signer = SigningService(auto_generate=True)
+    results = []
+    
+    # verify_signed_attestation
+    attestation = _signed_attestation(signer, "claim", [compute_hash("cited")])
+    check(results, "signed attestation verifies", signer.verify_signed_attestation(attestation))
+    check(results, "verifies again from the cached citations hash",
+          signer.verify_signed_attestation(attestation))
+    
+    attestation.citations = [compute_hash("other")]
+    check(results, "reassigned citations do not verify",
+          not signer.verify_signed_attestation(attestation))
+    
+    attestation = _signed_attestation(signer, "claim", [compute_hash("cited")])
+    signer.verify_signed_attestation(attestation)
+    attestation.citations.append(compute_hash("extra"))
+    check(results, "edited citations do not verify",
+          not signer.verify_signed_attestation(attestation))
+    
+    attestation = _signed_attestation(signer, "claim", [])
+    attestation.claim_hash = compute_hash("tampered")
+    check(results, "tampered claim hash does not verify",
+          not signer.verify_signed_attestation(attestation))
+    
+    # verify_many: mixed valid and invalid items, another zone's key and
+    # an unknown (malformed) key
+    other = SigningService(auto_generate=True)
+    good = _signed_attestation(signer, "good", [])
+    other_good = _signed_attestation(other, "other", [])
+    
+    def sign_data(attestation: SignedAttestation) -> bytes:
+        return signer.compute_sign_data(
+            attestation.attestation_id, attestation.claim_hash,
+            attestation.evidence_hash, attestation.timestamp, attestation.citations
+        )
+    
+    results_many = signer.verify_many([
+        (sign_data(good), good.signature, None),
+        (sign_data(good), other_good.signature, None),
+        (sign_data(other_good), other_good.signature, other.public_key_hex),
+        (sign_data(good), good.signature, other.public_key_hex),
+        (sign_data(good), good.signature, "00" * 31),
+        (sign_data(good), good.signature, signer.public_key_hex),
+    ])
+    check(results, "verify_many returns one result per item", len(results_many) == 6)
+    check(results, "verify_many matches per-item results",
+          results_many == [True, False, True, False, False, True])
+    
+    print()
+    print("=" * 60)
+    passed = all(results)
+    print(f"  {'ALL PASSED' if passed else 'FAILURES'}: {sum(results)}/{len(results)}")
+    print("=" * 60)
+    return passed
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
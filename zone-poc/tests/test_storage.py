@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+RocksDB storage smoke test for Glogos Zone Reference
+Covers snapshots, bulk loads, statistics and the /metrics endpoint.
+
+Usage:
+    cd zone-poc
+    python -m tests.test_storage
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+# Add parent to path for zone import
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from zone.signer import compute_hash
+from zone.storage import ROCKSDB_AVAILABLE, RocksDBStorage
+
+
+def check(results: list, name: str, ok: bool) -> None:
+    print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+    results.append(ok)
+
+
+def check_storage(results: list, db_path: str) -> None:
+    """snapshot, bulk_mode, bulk_ingest_attestations and stats"""
+    storage = RocksDBStorage(db_path, cache_size_mb=8, enable_stats=True)
+    ids = [compute_hash(f"attestation_{i}") for i in range(10)]
+    
+    # bulk_mode + put_attestations_bulk
+    with storage.bulk_mode():
+        new = storage.put_attestations_bulk([(i, {"n": n}) for n, i in enumerate(ids[:5])])
+    check(results, "bulk_mode load stores every attestation",
+          new == 5 and storage.get_attestation(ids[4]) == {"n": 4})
+    
+    # bulk_ingest_attestations: new IDs counted, existing ones replaced
+    new = storage.bulk_ingest_attestations(
+        [(i, {"n": n}) for n, i in enumerate(ids[3:], start=3)] + [(ids[0], b'{"n":"raw"}')]
+    )
+    check(results, "bulk ingest counts only new IDs",
+          new == 5 and storage.attestation_count == 10)
+    check(results, "bulk ingest replaces stored values",
+          storage.get_attestation(ids[0]) == {"n": "raw"}
+          and storage.get_attestation(ids[9]) == {"n": 9})
+    check(results, "ingested count matches a full recount",
+          storage.recompute_attestation_count() == 10)
+    
+    # snapshot: point reads keep the view as of entry
+    late_id = compute_hash("late")
+    with storage.snapshot() as view:
+        storage.put_attestation(ids[1], {"n": "changed"})
+        storage.put_attestation(late_id, {"n": "late"})
+        unchanged = view.get(ids[1]) == {"n": 1}
+        missing = view.get(late_id) is None and view.get("not-an-id") is None
+    check(results, "snapshot reads ignore later writes", unchanged and missing)
+    try:
+        view.get(ids[1])
+        released = False
+    except RuntimeError:
+        released = True
+    check(results, "snapshot is released on exit", released)
+    
+    # stats
+    stats = storage.stats()
+    check(results, "stats report tickers and key estimates",
+          stats["enabled"]
+          and "rocksdb.block.cache.hit" in stats["tickers"]
+          and stats["estimate_num_keys"]["attestations"] > 0)
+    storage.close()
+
+
+def check_metrics(results: list, db_path: str) -> None:
+    """/metrics on the RocksDB app"""
+    os.environ["ZONE_DB_PATH"] = db_path
+    os.environ["ZONE_DB_STATS"] = "1"
+    from fastapi.testclient import TestClient
+    from zone.app_rocksdb import app, storage
+    
+    with TestClient(app) as client:
+        client.post("/verify", json={"claim": "metrics", "evidence": "smoke"})
+        response = client.get("/metrics")
+        body = response.json()
+    check(results, "/metrics serves storage stats",
+          response.status_code == 200 and body["enabled"] and "tickers" in body)
+    storage.close()
+
+
+def main():
+    print("=" * 60)
+    print("  GLOGOS STORAGE TEST")
+    print("=" * 60)
+    
+    if not ROCKSDB_AVAILABLE:
+        print("  rocksdict not installed, skipping")
+        return True
+    
+    results = []
+    work_dir = tempfile.mkdtemp(prefix="glogos_storage_test_")
+    try:
+        check_storage(results, os.path.join(work_dir, "storage.db"))
+        check_metrics(results, os.path.join(work_dir, "app.db"))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    print()
+    print("=" * 60)
+    passed = all(results)
+    print(f"  {'ALL PASSED' if passed else 'FAILURES'}: {sum(results)}/{len(results)}")
+    print("=" * 60)
+    return passed
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
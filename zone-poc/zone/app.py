@@ -10,22 +10,27 @@ Implements Attester Interface (Spec §5):
 
 Additional endpoints:
 - GET /health
+- GET /attestations/list
 """
 
+import asyncio
 import hashlib
+import logging
+import threading
 import time
 import os
-from typing import Optional
+import re
+from typing import Any, Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import ValidationError
 
 from .models import (
     AttestationCreate,
     SignedAttestation,
-    MerkleProof,
     BitcoinAnchor,
     AttestationResponse,
     ZoneInfoResponse,
@@ -36,17 +41,61 @@ from .signer import SigningService, compute_hash, DEFAULT_CANON_ID, CANON_IDS
 from .merkle import MerkleEngine
 
 
+logger = logging.getLogger(__name__)
+
+# Attestation IDs are SHA-256 hex digests (Spec §3.3), stored lowercase
+_HEX64_RE = re.compile(r"[0-9a-fA-F]{64}")
+
+
 # =============================================================================
 # In-Memory Storage (Replace with RocksDB for development)
 # =============================================================================
 
+class SerializedAttestations:
+    """
+    Dict-like view storing each attestation only as its JSON encoding.
+    
+    A bytes value is far smaller than the SignedAttestation model it came
+    from; models are rebuilt on read, which only non-hot paths need.
+    """
+    
+    def __init__(self, encoded: dict[str, bytes]):
+        self._encoded = encoded
+    
+    def __getitem__(self, key: str) -> SignedAttestation:
+        return SignedAttestation.model_validate_json(self._encoded[key])
+    
+    def get(self, key: str, default=None):
+        data = self._encoded.get(key)
+        return SignedAttestation.model_validate_json(data) if data is not None else default
+    
+    def __setitem__(self, key: str, value: SignedAttestation):
+        self._encoded[key] = orjson.dumps(value.model_dump(mode="json"))
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._encoded
+    
+    def __len__(self) -> int:
+        return len(self._encoded)
+    
+    def keys(self):
+        return self._encoded.keys()
+
+
 class Storage:
     """Simple in-memory storage for MVP"""
     
     def __init__(self):
-        self.attestations: dict[str, SignedAttestation] = {}
+        self.attestation_bytes: dict[str, bytes] = {}  # attestation_id -> serialized JSON
+        self.attestations = SerializedAttestations(self.attestation_bytes)
         self.evidence: dict[str, str] = {}  # attestation_id -> evidence content
         self.anchors: list[BitcoinAnchor] = []
+        self.latest_anchor: Optional[BitcoinAnchor] = None
+    
+    def append_anchor(self, anchor: BitcoinAnchor) -> None:
+        """Record a new anchor and make it the latest"""
+        self.anchors.append(anchor)
+        self.latest_anchor = anchor
 
 
 # =============================================================================
@@ -54,9 +103,21 @@ class Storage:
 # =============================================================================
 
 storage = Storage()
+
+# Reported as the proof anchor until the first real anchor is recorded
+_DEFAULT_ANCHOR = BitcoinAnchor(type="bitcoin", confirmations=0)
+_DEFAULT_ANCHOR_JSON = _DEFAULT_ANCHOR.model_dump(mode="json")
 signer = SigningService(auto_generate=True)
 merkle = MerkleEngine()
 
+# Guards storage/merkle, which /verify mutates from worker threads
+_state_lock = threading.Lock()
+
+# Pre-serialized GET bodies, rebuilt only when their cache key changes
+_root_overview: Optional[bytes] = None
+_info_cache: Optional[tuple[int, bytes]] = None  # (anchor count, body)
+_root_cache: Optional[tuple[int, int, bytes]] = None  # (leaf count, anchor count, body)
+
 # Zone configuration
 ZONE_NAME = os.environ.get("ZONE_NAME", "Glogos High-Throughput Zone")
 ZONE_DESCRIPTION = os.environ.get(
@@ -69,6 +130,19 @@ ZONE_DESCRIPTION = os.environ.get(
 GLSR = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 GLSR_STATUS = "official"  # GLSR is fixed forever (mathematical constant)
 
+ZONE_INFO_ENDPOINTS = {
+    "attestation": "/attestation/{id}",
+    "merkle_root": "/merkle/root",
+    "submit": "/verify"
+}
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -79,6 +153,7 @@ async def lifespan(app: FastAPI):
     print(f"   Spec Version: 1.0-rc.0")
     print(f"   GLSR: {GLSR[:16]}... ({GLSR_STATUS})")
     yield
+    await proof_batcher.stop()
     print(f"👋 Shutting down {ZONE_NAME}")
 
 
@@ -86,7 +161,8 @@ app = FastAPI(
     title="Glogos High-Throughput Attester",
     description="Implementation of Glogos Specification v1.0-rc.0",
     version="1.0-rc.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -123,7 +199,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         detail=str(exc.detail),
         instance=str(request.url.path)
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=problem.model_dump(exclude_none=True),
         headers={"Content-Type": "application/problem+json"}
@@ -140,7 +216,7 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
         detail=str(exc),
         instance=str(request.url.path)
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content=problem.model_dump(exclude_none=True),
         headers={"Content-Type": "application/problem+json"}
@@ -154,138 +230,171 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with API overview"""
-    return {
-        "name": ZONE_NAME,
-        "version": "1.0-rc.0",
-        "specification": "Glogos Protocol v1.0-rc.0",
-        "zone_id": signer.zone_id,
-        "glsr": GLSR,
-        "glsr_status": GLSR_STATUS,
-        "endpoints": {
-            "zone_info": "/zone/info",
-            "attestation": "/attestation/{id}",
-            "merkle_root": "/merkle/root",
-            "verify": "/verify",
-            "health": "/health"
-        }
-    }
-
-
-@app.get("/zone/info", response_model=ZoneInfoResponse, tags=["Zone Interface"])
+    global _root_overview
+    
+    # Nothing here changes after startup, so serialize it once
+    if _root_overview is None:
+        _root_overview = orjson.dumps({
+            "name": ZONE_NAME,
+            "version": "1.0-rc.0",
+            "specification": "Glogos Protocol v1.0-rc.0",
+            "zone_id": signer.zone_id,
+            "glsr": GLSR,
+            "glsr_status": GLSR_STATUS,
+            "endpoints": {
+                "zone_info": "/zone/info",
+                "attestation": "/attestation/{id}",
+                "merkle_root": "/merkle/root",
+                "verify": "/verify",
+                "attestations": "/attestations/list",
+                "health": "/health"
+            }
+        })
+    return Response(_root_overview, media_type="application/json")
+
+
+@app.get("/zone/info", responses={200: {"model": ZoneInfoResponse}}, tags=["Zone Interface"])
 async def get_zone_info():
     """
     GET /zone/info - Specification §5.3
     
     Returns Zone metadata and capabilities.
     """
-    latest_anchor = storage.anchors[-1] if storage.anchors else None
+    global _info_cache
     
-    return ZoneInfoResponse(
-        zone_id=signer.zone_id,
-        name=ZONE_NAME,
-        description=ZONE_DESCRIPTION,
-        public_key=signer.public_key_hex,
-        public_key_type="ed25519",
-        supported_canons=list(CANON_IDS.keys()),
-        api_version="0.5.1",
-        spec_version="0.5.1",
-        glsr_reference=GLSR,
-        glsr_status=GLSR_STATUS,
-        latest_anchor=latest_anchor,
-        endpoints={
-            "attestation": "/attestation/{id}",
-            "merkle_root": "/merkle/root",
-            "submit": "/verify"
-        }
-    )
+    # Everything but the latest anchor is fixed at startup
+    anchor_count = len(storage.anchors)
+    if _info_cache is None or _info_cache[0] != anchor_count:
+        latest_anchor = storage.latest_anchor
+        
+        info = ZoneInfoResponse(
+            zone_id=signer.zone_id,
+            name=ZONE_NAME,
+            description=ZONE_DESCRIPTION,
+            public_key=signer.public_key_hex,
+            public_key_type="ed25519",
+            supported_canons=list(CANON_IDS.keys()),
+            api_version="0.5.1",
+            spec_version="0.5.1",
+            glsr_reference=GLSR,
+            glsr_status=GLSR_STATUS,
+            latest_anchor=latest_anchor,
+            endpoints=ZONE_INFO_ENDPOINTS
+        )
+        _info_cache = (anchor_count, orjson.dumps(info.model_dump(mode="json")))
+    
+    return Response(_info_cache[1], media_type="application/json")
+
+
+def validate_aid(attestation_id: str) -> str:
+    """Reject malformed attestation IDs before the handler runs"""
+    if not _HEX64_RE.fullmatch(attestation_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid attestation ID format. Expected 64 hex characters"
+        )
+    return attestation_id.lower()
+
+
+def _anchor_json() -> dict:
+    """Latest anchor as a JSON-ready dict (the placeholder if none yet)"""
+    anchor = storage.latest_anchor
+    if anchor is None:
+        return _DEFAULT_ANCHOR_JSON
+    return anchor.model_dump(mode="json") if isinstance(anchor, BitcoinAnchor) else anchor
+
+
+def _attestation_response(attestation_bytes: bytes, proof_data: dict) -> Response:
+    """
+    Splice stored attestation JSON and a fresh proof into one response body.
+    
+    proof_data from MerkleEngine already has the MerkleProof fields, so it
+    is serialized as-is with the anchor added instead of being validated
+    into a model first.
+    """
+    proof_data["anchor"] = _anchor_json()
+    body = b'{"attestation":' + attestation_bytes + b',"proof":' + orjson.dumps(proof_data) + b'}'
+    return Response(body, media_type="application/json")
 
 
-@app.get("/attestation/{attestation_id}", response_model=AttestationResponse, tags=["Zone Interface"])
-async def get_attestation(attestation_id: str):
+@app.get("/attestation/{attestation_id}", responses={200: {"model": AttestationResponse}}, tags=["Zone Interface"])
+async def get_attestation(attestation_id: str = Depends(validate_aid)):
     """
     GET /attestation/{id} - Specification §5.4
     
     Returns attestation with Merkle proof.
     """
-    attestation_id = attestation_id.lower()
-    
-    # Validate format
-    if len(attestation_id) != 64:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid attestation ID format. Expected 64 hex characters, got {len(attestation_id)}"
-        )
-    
     # Lookup attestation
-    print(f"[DEBUG] Looking up: {attestation_id[:16]}... in {len(storage.attestations)} attestations")
-    print(f"[DEBUG] Storage keys: {list(storage.attestations.keys())[:3] if storage.attestations else 'empty'}")
-    attestation = storage.attestations.get(attestation_id)
-    if not attestation:
+    logger.debug("Looking up %s... in %d attestations", attestation_id[:16], len(storage.attestations))
+    attestation_bytes = storage.attestation_bytes.get(attestation_id)
+    if attestation_bytes is None:
         raise HTTPException(
             status_code=404,
             detail=f"Attestation {attestation_id[:16]}... not found"
         )
     
     # Generate Merkle proof
-    proof_data = merkle.generate_proof(attestation_id)
+    with _state_lock:
+        proof_data = merkle.generate_proof(attestation_id)
     if not proof_data:
         raise HTTPException(
             status_code=500,
             detail="Failed to generate Merkle proof"
         )
     
-    # Get anchor info
-    anchor = storage.anchors[-1] if storage.anchors else BitcoinAnchor(
-        type="bitcoin",
-        confirmations=0
-    )
-    
-    proof = MerkleProof(
-        version=proof_data["version"],
-        leaf_hash=proof_data["leaf_hash"],
-        leaf_index=proof_data["leaf_index"],
-        proof=proof_data["proof"],
-        root=proof_data["root"],
-        anchor=anchor
-    )
-    
-    return AttestationResponse(
-        attestation=attestation,
-        proof=proof
-    )
+    return _attestation_response(attestation_bytes, proof_data)
 
 
-@app.get("/merkle/root", response_model=MerkleRootResponse, tags=["Zone Interface"])
+@app.get("/merkle/root", responses={200: {"model": MerkleRootResponse}}, tags=["Zone Interface"])
 async def get_merkle_root():
     """
     GET /merkle/root - Specification §5
     
     Returns current Merkle root and anchor info.
+    The body is rebuilt only after new leaves or anchors, so
+    last_updated is the time the root last changed.
     """
-    root = merkle.compute_root()
-    anchor = storage.anchors[-1] if storage.anchors else None
-    
-    return MerkleRootResponse(
-        merkle_root=root,
-        attestation_count=merkle.leaf_count,
-        last_updated=int(time.time()),
-        anchor=anchor
-    )
+    global _root_cache
+    
+    with _state_lock:
+        leaf_count = merkle.leaf_count
+        anchor_count = len(storage.anchors)
+        if _root_cache is None or _root_cache[:2] != (leaf_count, anchor_count):
+            anchor = storage.latest_anchor
+            response = MerkleRootResponse(
+                merkle_root=merkle.compute_root(),
+                attestation_count=leaf_count,
+                last_updated=int(time.time()),
+                anchor=anchor
+            )
+            _root_cache = (leaf_count, anchor_count, orjson.dumps(response.model_dump(mode="json")))
+        body = _root_cache[2]
+    
+    return Response(body, media_type="application/json")
 
 
-@app.post("/verify", response_model=AttestationResponse, tags=["Zone Interface"])
-async def create_attestation(request: AttestationCreate):
+# Payloads at least this long are hashed in a worker thread; below it the
+# thread hop costs more than the hash
+HASH_OFFLOAD_THRESHOLD = 4096
+
+
+async def _hash_payload(data: str) -> str:
+    """SHA-256 a claim/evidence string, off the event loop if it is large"""
+    if len(data) < HASH_OFFLOAD_THRESHOLD:
+        return compute_hash(data)
+    return await asyncio.to_thread(compute_hash, data)
+
+
+def _build_attestation(
+    request: AttestationCreate,
+    claim_hash: str,
+    evidence_hash: str
+) -> SignedAttestation:
     """
-    POST /verify - Create new attestation
+    Sign a new attestation (runs in a worker thread).
     
-    This endpoint receives a claim and evidence, verifies them (Zone-specific),
-    and creates a signed attestation.
+    It is stored by the proof batcher once its Merkle leaf exists.
     """
-    start_time = time.perf_counter()
-    
-    # Compute hashes
-    claim_hash = compute_hash(request.claim)
-    evidence_hash = compute_hash(request.evidence)
     timestamp = int(time.time())
     
     # Determine Canon ID
@@ -321,53 +430,153 @@ async def create_attestation(request: AttestationCreate):
         glsr_anchor=GLSR  # Optional GLSR anchoring
     )
     
-    # Store attestation and evidence (normalize to lowercase for consistent lookup)
-    storage.attestations[attestation_id.lower()] = attestation
-    storage.evidence[attestation_id.lower()] = request.evidence
-    print(f"[DEBUG] Stored attestation: {attestation_id.lower()[:16]}... (total: {len(storage.attestations)})")
+    return attestation
+
+
+def _insert_and_prove(records: list[tuple[SignedAttestation, str]]) -> list[dict]:
+    """
+    Add a batch of leaves, store the attestations and prove each of them
+    (runs in a worker thread).
+    
+    Attestations are stored only after their leaves are added, under the
+    same lock, so GET /attestation never finds one it cannot prove.
+    """
+    attestation_ids = [attestation.attestation_id for attestation, _ in records]
+    with _state_lock:
+        merkle.add_leaves(attestation_ids)
+        # Store attestation and evidence (hexdigest IDs are already lowercase)
+        for attestation, evidence in records:
+            storage.attestations[attestation.attestation_id] = attestation
+            storage.evidence[attestation.attestation_id] = evidence
+        logger.debug("Stored %d attestations (total: %d)", len(records), len(storage.attestations))
+        return merkle.generate_proofs(attestation_ids)
+
+
+class ProofBatcher:
+    """
+    Coalesce concurrent /verify Merkle inserts.
+    
+    Requests queue their signed attestation and evidence and await a
+    future. A single background task collects up to `max_batch` of them
+    (waiting at most `window` seconds after the first), adds them to the
+    tree in one call, stores them and resolves every future from one tree
+    build.
+    """
+    
+    def __init__(self, max_batch: int = 64, window: float = 0.005):
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
     
-    # Add to Merkle tree
-    merkle.add_leaf(attestation_id)
+    async def submit(self, attestation: SignedAttestation, evidence: str) -> dict:
+        """Queue an attestation and wait for its proof"""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((attestation, evidence), future))
+        return await future
     
-    # Generate proof
-    proof_data = merkle.generate_proof(attestation_id)
-    anchor = storage.anchors[-1] if storage.anchors else BitcoinAnchor(
-        type="bitcoin",
-        confirmations=0
-    )
+    async def stop(self) -> None:
+        """Cancel the background task"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
     
-    proof = MerkleProof(
-        version=proof_data["version"],
-        leaf_hash=proof_data["leaf_hash"],
-        leaf_index=proof_data["leaf_index"],
-        proof=proof_data["proof"],
-        root=proof_data["root"],
-        anchor=anchor
-    )
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            records = [record for record, _ in batch]
+            try:
+                proofs = await asyncio.to_thread(_insert_and_prove, records)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), proof_data in zip(batch, proofs):
+                if not future.done():
+                    future.set_result(proof_data)
+
+
+proof_batcher = ProofBatcher()
+
+
+@app.post("/verify", responses={200: {"model": AttestationResponse}}, tags=["Zone Interface"])
+async def create_attestation(request: AttestationCreate):
+    """
+    POST /verify - Create new attestation
+    
+    This endpoint receives a claim and evidence, verifies them (Zone-specific),
+    and creates a signed attestation.
+    """
+    start_time = time.perf_counter()
     
-    return AttestationResponse(
-        attestation=attestation,
-        proof=proof
+    # Claim and evidence hashes are independent; large ones hash in parallel
+    claim_hash, evidence_hash = await asyncio.gather(
+        _hash_payload(request.claim),
+        _hash_payload(request.evidence)
     )
+    
+    # Signing is CPU-bound; keep it off the event loop
+    attestation = await asyncio.to_thread(_build_attestation, request, claim_hash, evidence_hash)
+    
+    # Merkle insert, storage and proof are batched with concurrent requests
+    proof_data = await proof_batcher.submit(attestation, request.evidence)
+    
+    return _attestation_response(storage.attestation_bytes[attestation.attestation_id], proof_data)
 
 
 # =============================================================================
 # Additional Endpoints
 # =============================================================================
 
-@app.get("/health", tags=["Operations"])
+@app.get("/health", response_class=ORJSONResponse, tags=["Operations"])
 async def health_check():
     """Health check endpoint"""
+    with _state_lock:
+        root = merkle.compute_root()
     return {
         "status": "healthy",
         "zone_id": signer.zone_id,
         "attestation_count": len(storage.attestations),
-        "merkle_root": merkle.compute_root(),
+        "merkle_root": root,
         "timestamp": int(time.time())
     }
 
 
-
+@app.get("/attestations/list", tags=["Operations"])
+async def list_attestations():
+    """
+    List all stored attestations.
+    
+    The array is streamed one stored attestation at a time, so the full
+    body is never built in memory.
+    """
+    with _state_lock:
+        attestation_ids = list(storage.attestations.keys())
+    
+    async def stream():
+        yield b'{"attestations":['
+        separator = b''
+        for attestation_id in attestation_ids:
+            yield separator + storage.attestation_bytes[attestation_id]
+            separator = b','
+        yield b']}'
+    
+    return StreamingResponse(stream(), media_type="application/json")
 
 
 # =============================================================================
@@ -390,4 +599,11 @@ if __name__ == "__main__":
     
     print(f"{'='*60}\n")
     
-    uvicorn.run(app, host=host, port=port)
+    # Single worker: the Merkle tree and auto-generated signing key live in
+    # process memory, so extra workers would each run a different zone.
+    # uvloop/httptools come with uvicorn[standard]. The per-request access
+    # log is off; set ACCESS_LOG=1 to turn it back on.
+    uvicorn.run(
+        app, host=host, port=port, loop="uvloop", http="httptools",
+        access_log=os.environ.get("ACCESS_LOG") == "1"
+    )
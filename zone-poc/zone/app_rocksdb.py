@@ -7,6 +7,8 @@ Run:
 
 Or with environment variables:
     ZONE_NAME="My Zone" PORT=8001 python -m zone.app_rocksdb
+
+Set ZONE_DB_STATS=1 to collect RocksDB statistics (served at /metrics).
 """
 
 import os
@@ -17,13 +19,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from zone.app import (
     app, signer, merkle, ZONE_NAME, GLSR, GLSR_STATUS,
-    lifespan, create_problem_detail
+    lifespan, create_problem_detail, ORJSONResponse
 )
 from zone.storage import StorageAdapter
 
 # Replace in-memory storage with RocksDB
 DB_PATH = os.environ.get("ZONE_DB_PATH", "./data/zone.db")
-storage = StorageAdapter(DB_PATH)
+DB_STATS = os.environ.get("ZONE_DB_STATS") == "1"
+storage = StorageAdapter(DB_PATH, enable_stats=DB_STATS)
 
 # Monkey-patch the storage in app module
 import zone.app as app_module
@@ -32,6 +35,12 @@ app_module.storage = storage
 print(f"[DB] Using RocksDB storage: {DB_PATH}")
 
 
+@app.get("/metrics", response_class=ORJSONResponse, tags=["Operations"])
+async def metrics():
+    """RocksDB statistics (tickers need ZONE_DB_STATS=1)"""
+    return storage.stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -48,4 +57,11 @@ if __name__ == "__main__":
     print(f"  Docs: http://{host}:{port}/docs")
     print(f"{'='*60}\n")
     
-    uvicorn.run(app, host=host, port=port)
+    # Single worker: the Merkle tree and auto-generated signing key live in
+    # process memory, so extra workers would each run a different zone.
+    # uvloop/httptools come with uvicorn[standard]. The per-request access
+    # log is off; set ACCESS_LOG=1 to turn it back on.
+    uvicorn.run(
+        app, host=host, port=port, loop="uvloop", http="httptools",
+        access_log=os.environ.get("ACCESS_LOG") == "1"
+    )
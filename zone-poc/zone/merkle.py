@@ -10,8 +10,9 @@ Features:
 """
 
 import hashlib
+from bisect import bisect_left
 from typing import List, Optional, Tuple
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 import os
 
 
@@ -25,39 +26,58 @@ def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def _compute_subtree_root(leaves_hex: List[str]) -> str:
+# Empty tree root = SHA256("") (Spec §4.4 rule 5), computed once at import
+EMPTY_ROOT_BYTES = sha256_bytes(b"")
+EMPTY_ROOT = EMPTY_ROOT_BYTES.hex()
+
+
+def _next_level(level: List[bytes]) -> List[bytes]:
+    """
+    Hash one tree level into its parent level.
+    
+    Pairs come from two slices zipped together and hashlib.sha256 is bound
+    locally, so each parent costs a single C-level hash call with no
+    per-pair index arithmetic, branch or wrapper frame.
+    """
+    if len(level) & 1:
+        # Odd count: duplicate last node (Spec §4.4)
+        level = level + [level[-1]]
+    sha256 = hashlib.sha256
+    return [sha256(left + right).digest() for left, right in zip(level[0::2], level[1::2])]
+
+
+def _compute_packed_subtree_levels(packed: bytes, height: int) -> List[bytes]:
     """
-    Compute Merkle root for a list of leaf hashes.
+    Hash the levels of one aligned 2**height-leaf subtree.
     Worker function for parallel processing.
     
+    Leaves arrive packed back to back (32 bytes each), which pickles as a
+    single buffer copy. A short (last) chunk is paired with itself on the
+    way up exactly as the duplicate-last rule (Spec §4.4) does when it is
+    hashed as part of the full tree, so every returned level is the
+    chunk's slice of the full tree's level.
+    
     Args:
-        leaves_hex: List of 64-char hex hashes (already sorted)
+        packed: Concatenated 32-byte leaf hashes (already sorted)
+        height: Height of the aligned subtree (chunk size = 2**height)
     
     Returns:
-        Root hash as 64-char hex string
+        Levels 1..height, each packed as concatenated 32-byte hashes
     """
-    if not leaves_hex:
-        return sha256_hex(b"")  # Empty tree
-    
-    if len(leaves_hex) == 1:
-        return leaves_hex[0]
-    
-    # Convert to bytes for processing
-    level = [bytes.fromhex(h) for h in leaves_hex]
-    
-    while len(level) > 1:
-        next_level = []
-        
-        for i in range(0, len(level), 2):
-            left = level[i]
-            # Odd count: duplicate last leaf (Spec §4.4)
-            right = level[i + 1] if i + 1 < len(level) else level[i]
-            parent = sha256_bytes(left + right)
-            next_level.append(parent)
-        
-        level = next_level
-    
-    return level[0].hex()
+    level = [packed[i:i + 32] for i in range(0, len(packed), 32)]
+    levels = []
+    for _ in range(height):
+        level = _next_level(level)
+        levels.append(b"".join(level))
+    return levels
+
+
+def _decode_leaf(attestation_id: str) -> bytes:
+    """Decode a 64-char hex attestation ID to its 32-byte leaf"""
+    leaf = bytes.fromhex(attestation_id) if len(attestation_id) == 64 else b""
+    if len(leaf) != 32:
+        raise ValueError("Attestation ID must be 64-character hex string")
+    return leaf
 
 
 class MerkleEngine:
@@ -78,9 +98,18 @@ class MerkleEngine:
         """
         self.max_workers = max_workers or os.cpu_count() or 4
         self.parallel_threshold = parallel_threshold
-        self._leaves: List[str] = []
-        self._sorted_leaves: Optional[List[str]] = None
+        # Leaves are kept as raw 32-byte digests; bytes order equals the
+        # lexicographic order of their lowercase hex (Spec §4.4 rule 2).
+        # _leaves stays sorted; new leaves wait in _pending until the next
+        # read merges them in
+        self._leaves: List[bytes] = []
+        self._pending: List[bytes] = []
+        # Hashed tree levels above the leaves, valid left of _dirty_from
+        # (first sorted leaf position changed since they were built)
+        self._levels: List[List[bytes]] = [self._leaves]
+        self._dirty_from: Optional[int] = 0
         self._cached_root: Optional[str] = None
+        self._pool: Optional[ProcessPoolExecutor] = None  # Created on first parallel use
     
     def add_leaf(self, attestation_id: str) -> int:
         """
@@ -89,20 +118,97 @@ class MerkleEngine:
         Returns:
             Index of the leaf (before sorting)
         """
-        if len(attestation_id) != 64:
+        self._pending.append(_decode_leaf(attestation_id))
+        self._cached_root = None
+        
+        return self.leaf_count - 1
+    
+    def add_leaves(self, attestation_ids: List[str]) -> int:
+        """
+        Add a batch of attestation IDs as leaf nodes.
+        
+        Caches are invalidated once for the whole batch, so the next root
+        computation hashes every level exactly once.
+        
+        Returns:
+            Index of the first added leaf (before sorting)
+        """
+        # Decode in one comprehension with fromhex bound locally, then
+        # check lengths in bulk: every leaf is 32 bytes and the IDs total
+        # 64 chars each only if every ID is exactly 64 hex chars
+        fromhex = bytes.fromhex
+        leaves = [fromhex(attestation_id) for attestation_id in attestation_ids]
+        if leaves and (
+            set(map(len, leaves)) != {32}
+            or sum(map(len, attestation_ids)) != 64 * len(leaves)
+        ):
             raise ValueError("Attestation ID must be 64-character hex string")
         
-        self._leaves.append(attestation_id.lower())
-        self._sorted_leaves = None  # Invalidate cache
+        start = self.leaf_count
+        self._pending.extend(leaves)
         self._cached_root = None
         
-        return len(self._leaves) - 1
+        return start
     
-    def _ensure_sorted(self) -> List[str]:
-        """Sort leaves lexicographically (Spec §4.4 rule 2)"""
-        if self._sorted_leaves is None:
-            self._sorted_leaves = sorted(self._leaves)
-        return self._sorted_leaves
+    def _ensure_sorted(self) -> List[bytes]:
+        """
+        Sort leaves lexicographically (Spec §4.4 rule 2).
+        
+        Only the pending leaves are sorted; appending them as a second run
+        lets Timsort merge it into the already sorted leaves in linear time
+        instead of re-sorting everything.
+        """
+        if self._pending:
+            self._pending.sort()
+            # Every position from the first insertion point onward shifts
+            first = bisect_left(self._leaves, self._pending[0])
+            if self._dirty_from is None or first < self._dirty_from:
+                self._dirty_from = first
+            self._leaves.extend(self._pending)
+            self._leaves.sort()
+            self._pending = []
+        return self._leaves
+    
+    def _ensure_levels(self) -> List[List[bytes]]:
+        """
+        Bring the cached tree levels up to date.
+        
+        Only parents to the right of the first changed leaf are rehashed;
+        everything to its left is reused. A leaf that sorts near the end
+        costs about O(log n) hashes, and a random one about half a rebuild.
+        """
+        self._ensure_sorted()
+        start = self._dirty_from
+        if start is None:
+            return self._levels
+        
+        levels = self._levels
+        height = 0
+        while len(levels[height]) > 1:
+            start >>= 1  # First parent whose children changed
+            tail = _next_level(levels[height][2 * start:])
+            if height + 1 < len(levels):
+                parents = levels[height + 1]
+                del parents[start:]
+                parents.extend(tail)
+            else:
+                levels.append(tail)
+            height += 1
+        
+        self._dirty_from = None
+        return levels
+    
+    def _find_leaf(self, attestation_id: str) -> Optional[int]:
+        """First sorted position of a leaf by binary search, or None if absent"""
+        try:
+            leaf = bytes.fromhex(attestation_id)
+        except ValueError:
+            return None  # Not a hex ID, so not in tree
+        leaves = self._ensure_sorted()
+        i = bisect_left(leaves, leaf)
+        if i < len(leaves) and leaves[i] == leaf:
+            return i
+        return None
     
     def compute_root(self) -> str:
         """
@@ -114,8 +220,8 @@ class MerkleEngine:
         if self._cached_root is not None:
             return self._cached_root
         
-        leaves = self._ensure_sorted()
-        self._cached_root = _compute_subtree_root(leaves)
+        levels = self._ensure_levels()
+        self._cached_root = levels[-1][0].hex() if levels[0] else EMPTY_ROOT
         return self._cached_root
     
     def compute_root_parallel(self) -> str:
@@ -131,33 +237,51 @@ class MerkleEngine:
         
         leaves = self._ensure_sorted()
         
-        # Use single-threaded for small sets
-        if len(leaves) < self.parallel_threshold:
+        # Use single-threaded for small sets, or when only a short suffix
+        # of the cached levels needs rehashing
+        dirty_from = self._dirty_from
+        if (
+            len(leaves) < self.parallel_threshold
+            or dirty_from is None
+            or len(leaves) - dirty_from < self.parallel_threshold
+        ):
             return self.compute_root()
         
-        # Split into chunks for parallel processing
-        chunk_size = max(len(leaves) // self.max_workers, 100)
-        chunks = [
-            leaves[i:i + chunk_size]
+        # Split into power-of-two chunks so each one is a complete subtree
+        # of the full tree and its levels line up with the full tree's
+        chunk_size = max(len(leaves) // self.max_workers, 128)
+        height = chunk_size.bit_length() - 1
+        chunk_size = 1 << height
+        if chunk_size >= len(leaves):
+            return self.compute_root()
+        packed_chunks = [
+            b"".join(leaves[i:i + chunk_size])
             for i in range(0, len(leaves), chunk_size)
         ]
         
-        # Compute subtree roots in parallel
-        subtree_roots = []
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(_compute_subtree_root, chunk): i 
-                      for i, chunk in enumerate(chunks)}
-            
-            results = {}
-            for future in as_completed(futures):
-                idx = futures[future]
-                results[idx] = future.result()
-            
-            # Maintain order
-            subtree_roots = [results[i] for i in range(len(chunks))]
+        # Hash the chunk levels in parallel on the long-lived pool
+        # (map keeps chunk order)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        chunk_levels = list(self._pool.map(
+            _compute_packed_subtree_levels,
+            packed_chunks,
+            [height] * len(packed_chunks)
+        ))
         
-        # Combine subtree roots to get final root
-        self._cached_root = _compute_subtree_root(subtree_roots)
+        # Concatenating the chunks' levels gives the full tree's lower
+        # levels; only the few levels above the chunk roots are hashed here
+        levels = [leaves]
+        for h in range(height):
+            packed = b"".join(chunk[h] for chunk in chunk_levels)
+            levels.append([packed[i:i + 32] for i in range(0, len(packed), 32)])
+        while len(levels[-1]) > 1:
+            levels.append(_next_level(levels[-1]))
+        
+        # The result doubles as the level cache for proofs and later updates
+        self._levels = levels
+        self._dirty_from = None
+        self._cached_root = levels[-1][0].hex()
         return self._cached_root
     
     def generate_proof(self, attestation_id: str) -> Optional[dict]:
@@ -172,58 +296,90 @@ class MerkleEngine:
             or None if attestation not found
         """
         attestation_id = attestation_id.lower()
-        leaves = self._ensure_sorted()
-        
-        try:
-            leaf_index = leaves.index(attestation_id)
-        except ValueError:
+        leaf_index = self._find_leaf(attestation_id)
+        if leaf_index is None:
             return None  # Attestation not in tree
         
+        levels = self._ensure_levels()
+        return self._proof_from_levels(levels, attestation_id, leaf_index)
+    
+    def _proof_from_levels(
+        self,
+        levels: List[List[bytes]],
+        attestation_id: str,
+        leaf_index: int
+    ) -> dict:
+        """
+        Read a proof off the cached levels (no hashing).
+        
+        The sibling at each level is the node at index ^ 1; a missing
+        right sibling means the node was paired with itself ("*").
+        """
         proof = []
-        level = [bytes.fromhex(h) for h in leaves]
         current_index = leaf_index
+        for level in levels[:-1]:
+            sibling_index = current_index ^ 1
+            proof.append(level[sibling_index].hex() if sibling_index < len(level) else "*")
+            current_index >>= 1
         
-        while len(level) > 1:
-            next_level = []
-            
-            for i in range(0, len(level), 2):
-                left = level[i]
-                
-                # Handle odd count
-                if i + 1 < len(level):
-                    right = level[i + 1]
-                    is_duplicate = False
-                else:
-                    right = level[i]
-                    is_duplicate = True
-                
-                # Record sibling for proof
-                if i == current_index or i + 1 == current_index:
-                    if i == current_index:
-                        # Current is left, sibling is right
-                        sibling = "*" if is_duplicate else level[i + 1].hex()
-                    else:
-                        # Current is right, sibling is left
-                        sibling = level[i].hex()
-                    proof.append(sibling)
-                
-                parent = sha256_bytes(left + right)
-                next_level.append(parent)
-            
-            # Update index for next level
-            current_index = current_index // 2
-            level = next_level
-        
-        root = level[0].hex() if level else sha256_hex(b"")
+        if self._cached_root is None:
+            self._cached_root = levels[-1][0].hex()
         
         return {
             "version": "1.0",
             "leaf_hash": attestation_id,
             "leaf_index": leaf_index,
             "proof": proof,
-            "root": root
+            "root": self._cached_root
         }
     
+    def generate_proofs(self, attestation_ids: List[str]) -> List[Optional[dict]]:
+        """
+        Generate Merkle proofs for several attestations from one tree update.
+        
+        The cached levels are brought up to date once and every proof is
+        read off them, so a batch costs one update instead of one per proof.
+        
+        Args:
+            attestation_ids: 64-char hex attestation IDs
+        
+        Returns:
+            Proof dicts in the same order as attestation_ids
+            (None for IDs not in the tree)
+        """
+        levels = self._ensure_levels()
+        
+        proofs: List[Optional[dict]] = []
+        for attestation_id in attestation_ids:
+            attestation_id = attestation_id.lower()
+            leaf_index = self._find_leaf(attestation_id)
+            if leaf_index is None:
+                proofs.append(None)
+            else:
+                proofs.append(self._proof_from_levels(levels, attestation_id, leaf_index))
+        
+        return proofs
+    
+    def compute_root_and_proofs(
+        self,
+        attestation_ids: List[str]
+    ) -> Tuple[str, List[Optional[dict]]]:
+        """
+        Compute the root and proofs for several attestations in one pass.
+        
+        The levels are updated once; the root is their top node and every
+        proof is read off them, so nothing is hashed twice.
+        
+        Args:
+            attestation_ids: 64-char hex attestation IDs
+        
+        Returns:
+            (64-char hex root, proof dicts in the same order as
+            attestation_ids, None for IDs not in the tree)
+        """
+        proofs = self.generate_proofs(attestation_ids)
+        return self.compute_root(), proofs
+    
     @staticmethod
     def verify_proof(
         leaf_hash: str,
@@ -243,40 +399,75 @@ class MerkleEngine:
         Returns:
             True if proof is valid
         """
-        current = bytes.fromhex(leaf_hash)
+        try:
+            leaf = bytes.fromhex(leaf_hash)
+            root = bytes.fromhex(expected_root)
+            siblings = [None if sibling == "*" else bytes.fromhex(sibling) for sibling in proof]
+        except ValueError:
+            return False
+        
+        return MerkleEngine.verify_proof_bytes(leaf, leaf_index, siblings, root)
+    
+    @staticmethod
+    def verify_proof_bytes(
+        leaf: bytes,
+        leaf_index: int,
+        proof: List[Optional[bytes]],
+        expected_root: bytes
+    ) -> bool:
+        """
+        Verify a Merkle proof given as raw 32-byte hashes.
+        
+        Args:
+            leaf: 32-byte leaf hash
+            leaf_index: Position in sorted leaf array
+            proof: Sibling hashes, None where the node was duplicated ("*")
+            expected_root: Expected 32-byte Merkle root
+        
+        Returns:
+            True if proof is valid
+        """
+        sha256 = hashlib.sha256
+        current = leaf
         index = leaf_index
         
         for sibling in proof:
-            if sibling == "*":
-                sibling_hash = current
-            else:
-                sibling_hash = bytes.fromhex(sibling)
+            if sibling is None:
+                sibling = current
             
-            if index % 2 == 0:
-                # Current is LEFT child
-                current = sha256_bytes(current + sibling_hash)
-            else:
+            if index & 1:
                 # Current is RIGHT child
-                current = sha256_bytes(sibling_hash + current)
+                current = sha256(sibling + current).digest()
+            else:
+                # Current is LEFT child
+                current = sha256(current + sibling).digest()
             
-            index = index // 2
+            index >>= 1
         
-        return current.hex() == expected_root
+        return current == expected_root
     
     @property
     def leaf_count(self) -> int:
         """Number of leaves in tree"""
-        return len(self._leaves)
+        return len(self._leaves) + len(self._pending)
     
     def clear(self) -> None:
         """Clear all leaves and cached values"""
         self._leaves = []
-        self._sorted_leaves = None
+        self._pending = []
+        self._levels = [self._leaves]
+        self._dirty_from = 0
         self._cached_root = None
     
+    def close(self) -> None:
+        """Shut down the worker pool used by compute_root_parallel"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
     def get_all_leaves(self) -> List[str]:
         """Get all leaves (sorted)"""
-        return self._ensure_sorted()
+        return [leaf.hex() for leaf in self._ensure_sorted()]
 
 
 # =============================================================================
@@ -9,12 +9,12 @@ These models support:
 - GLSR (Glogos State Root) anchoring
 """
 
-from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, ConfigDict
-import hashlib
-import struct
+from typing import List, Optional, Literal, Tuple
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 import time
 
+from .signer import compute_attestation_id, hash_citations
+
 
 # =============================================================================
 # Core Models (Spec §3)
@@ -43,26 +43,32 @@ class SignedAttestation(BaseModel):
     signature: str = Field(..., description="Base64-encoded Ed25519 signature")
     glsr_anchor: Optional[str] = Field(None, pattern=r"^[a-f0-9]{64}$", description="Glogos State Root reference (optional)")
     
+    _citations_hash: Optional[Tuple[Tuple[str, ...], bytes]] = PrivateAttr(default=None)
+    
     @staticmethod
     def compute_attestation_id(zone_id: str, canon_id: str, claim_hash: str, timestamp: int) -> str:
         """Compute attestation ID per Spec §3.3"""
-        timestamp_bytes = struct.pack('>Q', timestamp)  # 8 bytes, big-endian
-        preimage = (
-            bytes.fromhex(zone_id) +
-            bytes.fromhex(canon_id) +
-            bytes.fromhex(claim_hash) +
-            timestamp_bytes
-        )
-        return hashlib.sha256(preimage).hexdigest()
+        return compute_attestation_id(zone_id, canon_id, claim_hash, timestamp)
     
     @staticmethod
     def compute_citations_hash(citations: List[str]) -> str:
         """Compute citations hash for signature per Spec §3.4"""
-        if not citations:
-            return hashlib.sha256(b"").hexdigest()
-        sorted_citations = sorted(citations)
-        concatenated = "".join(sorted_citations)
-        return hashlib.sha256(concatenated.encode('utf-8')).hexdigest()
+        return hash_citations(citations).hex()
+    
+    @property
+    def citations_hash_bytes(self) -> bytes:
+        """
+        Citations hash for this attestation.
+        
+        Cached together with the citations it was computed from, so a
+        reassigned or edited citations list is hashed afresh.
+        """
+        citations = tuple(self.citations)
+        cached = self._citations_hash
+        if cached is None or cached[0] != citations:
+            cached = (citations, hash_citations(citations))
+            self._citations_hash = cached
+        return cached[1]
 
 
 # =============================================================================
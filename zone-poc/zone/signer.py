@@ -12,13 +12,71 @@ import os
 import hashlib
 import struct
 import base64
-from typing import Optional, Tuple, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, List
 from pathlib import Path
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 from cryptography.hazmat.primitives import serialization
 from cryptography.exceptions import InvalidSignature
 
+if TYPE_CHECKING:
+    from .models import SignedAttestation
+
+
+# zone_id || canon_id || claim_hash || timestamp (Spec §3.3)
+_ATTESTATION_ID_PREIMAGE = struct.Struct('>32s32s32sQ')
+# attestation_id || claim_hash || evidence_hash || timestamp || citations_hash (Spec §3.4)
+_SIGN_DATA = struct.Struct('>32s32s32sQ32s')
+_EMPTY_CITATIONS_HASH = hashlib.sha256(b"").digest()
+
+
+def _digest_bytes(hex_digest: str) -> bytes:
+    """
+    Decode a 64-char hex digest.
+    
+    struct pads short '32s' fields with zeros and truncates long ones, so
+    anything that is not exactly 32 bytes is rejected before packing.
+    """
+    value = bytes.fromhex(hex_digest)
+    if len(value) != 32:
+        raise ValueError(f"Expected a 64-character hex digest, got {len(value)} bytes")
+    return value
+
+
+@lru_cache(maxsize=64)
+def _canon_id_bytes(canon_id: str) -> bytes:
+    """Decode a Canon ID once; there are only a handful in use"""
+    return _digest_bytes(canon_id)
+
+
+def hash_citations(citations: Optional[List[str]]) -> bytes:
+    """SHA256 over the sorted, concatenated citation IDs (Spec §3.4)"""
+    if not citations:
+        return _EMPTY_CITATIONS_HASH
+    hasher = hashlib.sha256()
+    for citation in sorted(citations):
+        hasher.update(citation.encode('utf-8'))
+    return hasher.digest()
+
+
+def attestation_id_hasher(zone_id: bytes, canon_id: bytes) -> Callable[[bytes], bytes]:
+    """
+    Attestation ID hasher specialized to one zone and canon.
+    
+    zone_id || canon_id is exactly one 64-byte SHA-256 block, so the
+    returned function resumes from that midstate and only absorbs
+    claim_hash || timestamp_bytes.
+    """
+    resume = hashlib.sha256(zone_id + canon_id).copy
+    
+    def hasher(tail: bytes) -> bytes:
+        h = resume()
+        h.update(tail)
+        return h.digest()
+    
+    return hasher
+
 
 class SigningService:
     """
@@ -39,6 +97,7 @@ class SigningService:
         self._private_key: Optional[Ed25519PrivateKey] = None
         self._public_key_bytes: Optional[bytes] = None
         self._zone_id: Optional[str] = None
+        self._zone_id_bytes: Optional[bytes] = None
         
         # Try loading key from various sources
         loaded = False
@@ -89,7 +148,8 @@ class SigningService:
             format=serialization.PublicFormat.Raw
         )
         # Zone ID = SHA256(public_key_bytes) per Spec §3.2
-        self._zone_id = hashlib.sha256(self._public_key_bytes).hexdigest()
+        self._zone_id_bytes = hashlib.sha256(self._public_key_bytes).digest()
+        self._zone_id = self._zone_id_bytes.hex()
     
     @property
     def public_key_hex(self) -> str:
@@ -133,12 +193,12 @@ class SigningService:
         
         attestation_id = SHA256(zone_id || canon_id || claim_hash || timestamp_bytes)
         """
-        timestamp_bytes = struct.pack('>Q', timestamp)  # 8 bytes, big-endian
-        preimage = (
-            bytes.fromhex(self._zone_id) +
-            bytes.fromhex(canon_id) +
-            bytes.fromhex(claim_hash) +
-            timestamp_bytes
+        # One pack call builds the 104-byte preimage (timestamp big-endian)
+        preimage = _ATTESTATION_ID_PREIMAGE.pack(
+            self._zone_id_bytes,
+            _canon_id_bytes(canon_id),
+            _digest_bytes(claim_hash),
+            timestamp
         )
         return hashlib.sha256(preimage).hexdigest()
     
@@ -148,32 +208,32 @@ class SigningService:
         claim_hash: str,
         evidence_hash: str,
         timestamp: int,
-        citations: Optional[List[str]] = None
+        citations: Optional[List[str]] = None,
+        citations_hash: Optional[bytes] = None
     ) -> bytes:
         """
         Compute data to be signed per Spec §3.4
         
         sign_data = attestation_id || claim_hash || evidence_hash || 
                     timestamp_bytes || citations_hash
-        """
-        timestamp_bytes = struct.pack('>Q', timestamp)
         
-        # Compute citations hash
-        if citations:
-            sorted_citations = sorted(citations)
-            citations_concat = "".join(sorted_citations)
-            citations_hash = hashlib.sha256(citations_concat.encode('utf-8')).digest()
-        else:
-            citations_hash = hashlib.sha256(b"").digest()
+        A precomputed citations_hash (32 bytes) skips hashing citations.
         
-        sign_data = (
-            bytes.fromhex(attestation_id) +
-            bytes.fromhex(claim_hash) +
-            bytes.fromhex(evidence_hash) +
-            timestamp_bytes +
+        Raises:
+            ValueError: If a hash is not exactly 32 bytes
+        """
+        if citations_hash is None:
+            citations_hash = hash_citations(citations)
+        elif len(citations_hash) != 32:
+            raise ValueError(f"citations_hash must be 32 bytes, got {len(citations_hash)}")
+        
+        return _SIGN_DATA.pack(
+            _digest_bytes(attestation_id),
+            _digest_bytes(claim_hash),
+            _digest_bytes(evidence_hash),
+            timestamp,
             citations_hash
         )
-        return sign_data
     
     def sign_attestation(
         self,
@@ -200,17 +260,23 @@ class SigningService:
         timestamp: int,
         citations: Optional[List[str]],
         signature_b64: str,
-        public_key_hex: Optional[str] = None
+        public_key_hex: Optional[str] = None,
+        citations_hash: Optional[bytes] = None
     ) -> bool:
         """
         Verify an attestation signature.
         
         If public_key_hex is provided, use that key.
         Otherwise, use this Zone's public key.
+        Hashes that are not exactly 32 bytes never verify.
         """
-        sign_data = self.compute_sign_data(
-            attestation_id, claim_hash, evidence_hash, timestamp, citations
-        )
+        try:
+            sign_data = self.compute_sign_data(
+                attestation_id, claim_hash, evidence_hash, timestamp, citations,
+                citations_hash
+            )
+        except ValueError:
+            return False
         signature_bytes = base64.b64decode(signature_b64)
         
         # Get public key
@@ -225,6 +291,59 @@ class SigningService:
             return True
         except InvalidSignature:
             return False
+    
+    def verify_many(
+        self,
+        items: List[Tuple[bytes, str, Optional[str]]]
+    ) -> List[bool]:
+        """
+        Verify many signatures, e.g. when re-auditing a whole zone.
+        
+        Each item is (sign_data, signature_b64, public_key_hex); a None key
+        means this Zone's key. Signatures are checked one at a time, but
+        each distinct public key is loaded only once. A malformed key
+        fails its items instead of raising.
+        
+        Returns:
+            One result per item, in order
+        """
+        keys = {None: self._private_key.public_key()}
+        results = []
+        for sign_data, signature_b64, public_key_hex in items:
+            if public_key_hex not in keys:
+                try:
+                    keys[public_key_hex] = Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key_hex))
+                except ValueError:
+                    keys[public_key_hex] = None
+            public_key = keys[public_key_hex]
+            if public_key is None:
+                results.append(False)
+                continue
+            try:
+                public_key.verify(base64.b64decode(signature_b64), sign_data)
+                results.append(True)
+            except InvalidSignature:
+                results.append(False)
+        return results
+    
+    def verify_signed_attestation(
+        self,
+        attestation: "SignedAttestation",
+        public_key_hex: Optional[str] = None
+    ) -> bool:
+        """
+        Verify a SignedAttestation, reusing its cached citations hash.
+        """
+        return self.verify_attestation(
+            attestation.attestation_id,
+            attestation.claim_hash,
+            attestation.evidence_hash,
+            attestation.timestamp,
+            attestation.citations,
+            attestation.signature,
+            public_key_hex,
+            citations_hash=attestation.citations_hash_bytes
+        )
 
 
 # =============================================================================
@@ -236,6 +355,21 @@ def compute_hash(data: str) -> str:
     return hashlib.sha256(data.encode('utf-8')).hexdigest()
 
 
+def compute_attestation_id(zone_id: str, canon_id: str, claim_hash: str, timestamp: int) -> str:
+    """
+    Compute attestation ID per Spec §3.3 for any zone
+    
+    attestation_id = SHA256(zone_id || canon_id || claim_hash || timestamp_bytes)
+    """
+    preimage = _ATTESTATION_ID_PREIMAGE.pack(
+        _digest_bytes(zone_id),
+        _canon_id_bytes(canon_id),
+        _digest_bytes(claim_hash),
+        timestamp
+    )
+    return hashlib.sha256(preimage).hexdigest()
+
+
 def compute_canon_id(name: str, version: str) -> str:
     """
     Compute Canon ID per Spec §8.1
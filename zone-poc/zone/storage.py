@@ -5,19 +5,85 @@ High-performance persistent storage for attestations
 Requires: pip install rocksdict
 """
 
-import json
 import os
-from typing import Optional, Iterator
-from dataclasses import asdict
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Optional, Iterator, List, Tuple, Union
+from dataclasses import is_dataclass
+
+import orjson
 
 try:
-    from rocksdict import Rdict
+    from rocksdict import (
+        BlockBasedOptions, Cache, DBCompressionType, IngestExternalFileOptions,
+        Options, Rdict, ReadOptions, SstFileWriter, WriteBatch, WriteOptions
+    )
     ROCKSDB_AVAILABLE = True
 except ImportError:
     ROCKSDB_AVAILABLE = False
     print("[WARN] rocksdict not installed. Run: pip install rocksdict")
 
 
+def _attestation_key(attestation_id: Union[str, bytes]) -> bytes:
+    """
+    Key for an attestation or its evidence: the raw 32-byte ID.
+    
+    Half the size of the hex text, so index and filter blocks hold twice
+    the keys. Decoding hex also makes the key case-insensitive. Already
+    encoded keys pass through.
+    """
+    if isinstance(attestation_id, bytes):
+        return attestation_id
+    key = bytes.fromhex(attestation_id) if len(attestation_id) == 64 else b""
+    if len(key) != 32:
+        raise ValueError("Attestation ID must be 64-character hex string")
+    return key
+
+
+def _lookup_key(attestation_id: Union[str, bytes]) -> Optional[bytes]:
+    """Key for a read; None for an ID that cannot name any attestation"""
+    try:
+        return _attestation_key(attestation_id)
+    except ValueError:
+        return None
+
+
+def _anchor_key(index: int) -> bytes:
+    """Anchor key: big-endian index, so key order is index order"""
+    return index.to_bytes(8, "big")
+
+
+def _counter_key(name: str) -> bytes:
+    """Meta key for a fixed-width counter (distinct from the JSON meta keys)"""
+    return b"counter:" + name.encode()
+
+
+# Record type -> JSON encoder, resolved on first sight of each type
+_ENCODERS: Dict[type, Callable[[Any], bytes]] = {}
+
+
+def _resolve_encoder(record_type: type) -> Callable[[Any], bytes]:
+    """Pick the encoder for a record type (dict, Pydantic model or dataclass)"""
+    if issubclass(record_type, dict) or is_dataclass(record_type):
+        encoder = orjson.dumps  # orjson handles both natively
+    elif hasattr(record_type, '__pydantic_serializer__'):
+        # Pydantic v2 serializes straight to JSON bytes, no dict in between
+        encoder = record_type.__pydantic_serializer__.to_json
+    elif hasattr(record_type, 'dict'):
+        encoder = lambda record: orjson.dumps(record.dict())  # Pydantic v1
+    else:
+        raise TypeError(f"Cannot store {record_type.__name__}")
+    _ENCODERS[record_type] = encoder
+    return encoder
+
+
+def _encode_record(record) -> bytes:
+    """Encode a dict, Pydantic model or dataclass as compact JSON bytes"""
+    encoder = _ENCODERS.get(type(record)) or _resolve_encoder(type(record))
+    return encoder(record)
+
+
 class RocksDBStorage:
     """
     High-performance persistent storage using RocksDB.
@@ -29,100 +95,527 @@ class RocksDBStorage:
     - meta: key -> value (counters, config)
     """
     
-    def __init__(self, db_path: str = "./data/zone.db"):
+    # Key prefixes of the old single-keyspace layout, migrated on open
+    _LEGACY_PREFIXES = (
+        (b"att:", "attestations"),
+        (b"ev:", "evidence"),
+        (b"anc:", "anchors"),
+        (b"meta:", "meta"),
+    )
+    
+    # Tickers reported by stats(): block cache, bloom filter and memtable
+    # effectiveness, plus raw I/O volume
+    _STATS_TICKERS = (
+        "rocksdb.block.cache.hit",
+        "rocksdb.block.cache.miss",
+        "rocksdb.block.cache.data.hit",
+        "rocksdb.block.cache.data.miss",
+        "rocksdb.bloom.filter.useful",
+        "rocksdb.bloom.filter.full.positive",
+        "rocksdb.bloom.filter.full.true.positive",
+        "rocksdb.memtable.hit",
+        "rocksdb.memtable.miss",
+        "rocksdb.bytes.read",
+        "rocksdb.bytes.written",
+    )
+    
+    def __init__(self, db_path: str = "./data/zone.db", cache_size_mb: int = 512,
+                 enable_stats: bool = False):
         if not ROCKSDB_AVAILABLE:
             raise RuntimeError("rocksdict not installed. Run: pip install rocksdict")
         
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
-        # Open RocksDB with column families
-        self.db = Rdict(db_path)
+        # Open RocksDB with column families; background work scales with
+        # the cores available so bulk ingest doesn't stall on compaction
+        threads = os.cpu_count() or 1
+        options = Options()
+        options.create_if_missing(True)
+        options.create_missing_column_families(True)
+        options.set_max_background_jobs(max(threads, 2))
+        options.set_max_subcompactions(threads)
+        # Pipelined (not unordered) writes: readers and snapshots never see
+        # half of a WriteBatch such as an attestation without its counter
+        options.set_enable_pipelined_write(True)
+        options.set_bytes_per_sync(1 << 20)
+        # Statistics cost a little CPU on every operation, so they are opt-in
+        self._stats_options = None
+        if enable_stats:
+            options.enable_statistics()
+            options.set_stats_dump_period_sec(60)
+            self._stats_options = options
+        # One block cache shared by every family, sized for the working set
+        block_cache = Cache(cache_size_mb << 20)
+        self._family_options = self._column_family_options(block_cache)
+        self.db = Rdict(db_path, options, column_families=self._family_options)
+        self._write_options = WriteOptions()
+        
+        # One handle per data type; keys carry no type prefix
+        self._attestations = self.db.get_column_family("attestations")
+        self._evidence = self.db.get_column_family("evidence")
+        self._anchors = self.db.get_column_family("anchors")
+        self._meta = self.db.get_column_family("meta")
+        self._attestations_cf = self.db.get_column_family_handle("attestations")
+        self._meta_cf = self.db.get_column_family_handle("meta")
+        self._migrate_prefixed_keys()
+        self._migrate_anchor_keys()
+        self._migrate_hex_keys()
+        self._migrate_json_counters()
         
-        # Use prefixes for different data types
-        self._attestation_prefix = b"att:"
-        self._evidence_prefix = b"ev:"
-        self._anchor_prefix = b"anc:"
-        self._meta_prefix = b"meta:"
+        # Anchor count comes from the last anchor key, so it can't drift
+        # from the anchors actually stored
+        last_anchor_key = next(iter(self._anchors.keys(backwards=True)), None)
+        self._anchor_count = int.from_bytes(last_anchor_key, "big") + 1 if last_anchor_key is not None else 0
         
-        # Cache for anchor count
-        self._anchor_count = self._get_meta("anchor_count", 0)
+        # Cached attestation count (databases from before the counter
+        # existed are counted once here)
+        self._attestation_count = self._get_counter("attestations")
+        if self._attestation_count is None:
+            self.recompute_attestation_count()
         
         print(f"[DB] RocksDB opened: {db_path}")
         print(f"[DB] Attestations: {self.attestation_count}")
     
+    @staticmethod
+    def _write_heavy_options() -> "Options":
+        """
+        Column family options for the families every new attestation writes.
+        
+        Large memtables (several of them, merged before flush) and a later
+        level-0 compaction trigger absorb write bursts without stalls.
+        """
+        threads = os.cpu_count() or 1
+        options = Options()
+        options.set_write_buffer_size(128 << 20)
+        options.set_max_write_buffer_number(max(threads // 2, 2))
+        options.set_min_write_buffer_number_to_merge(max(threads // 16, 1))
+        options.set_level_zero_file_num_compaction_trigger(max(threads * 4, 4))
+        return options
+    
+    @staticmethod
+    def _table_options(block_cache: "Cache") -> "BlockBasedOptions":
+        """
+        Block-based table options on the shared block cache.
+        
+        Index and filter blocks live in the cache (so they count against
+        its size) and level-0 ones are pinned, so a lookup never does I/O
+        just to find out where, or whether, a key is.
+        """
+        table_options = BlockBasedOptions()
+        table_options.set_block_cache(block_cache)
+        table_options.set_cache_index_and_filter_blocks(True)
+        table_options.set_pin_l0_filter_and_index_blocks_in_cache(True)
+        return table_options
+    
+    @classmethod
+    def _column_family_options(cls, block_cache: "Cache") -> dict:
+        """
+        Per-family options, tuned to each access pattern.
+        
+        Attestations are small values read by point lookup, so they get a
+        bloom filter. Evidence values are larger blobs: bigger blocks and
+        zstd compress them better. Both take every ingest write and use the
+        write-heavy memtable settings. Meta is tiny and keeps the defaults.
+        """
+        attestation_options = cls._write_heavy_options()
+        attestation_table = cls._table_options(block_cache)
+        attestation_table.set_block_size(16 * 1024)
+        attestation_table.set_bloom_filter(16, False)
+        attestation_table.set_format_version(5)
+        attestation_options.set_block_based_table_factory(attestation_table)
+        
+        evidence_options = cls._write_heavy_options()
+        evidence_table = cls._table_options(block_cache)
+        evidence_table.set_block_size(64 * 1024)
+        evidence_table.set_bloom_filter(10, False)
+        evidence_table.set_format_version(5)
+        evidence_options.set_block_based_table_factory(evidence_table)
+        evidence_options.set_compression_type(DBCompressionType.zstd())
+        # Large values fill files quickly; bigger SST files keep the file
+        # count (and open table handles) down as evidence grows
+        evidence_options.set_target_file_size_base(256 << 20)
+        # Evidence documents repeat the same structure across records, so
+        # zstd primes each SST file with a 16 KiB dictionary trained on
+        # ~100x that much sampled data (the size zstd's trainer suggests)
+        evidence_options.set_compression_options(-14, 3, 0, 16 << 10)
+        evidence_options.set_zstd_max_train_bytes(100 * (16 << 10))
+        # Evidence is only read for attestations known to exist, so skip
+        # bloom filters on the last level (most of the data) and leave the
+        # memory to the block cache; smaller levels keep theirs
+        evidence_options.set_optimize_filters_for_hits(True)
+        
+        # Same for anchors: get_latest_anchor always reads a valid index
+        anchor_options = Options()
+        anchor_table = cls._table_options(block_cache)
+        anchor_table.set_bloom_filter(10, False)
+        anchor_options.set_block_based_table_factory(anchor_table)
+        anchor_options.set_optimize_filters_for_hits(True)
+        
+        meta_options = Options()
+        meta_options.set_block_based_table_factory(cls._table_options(block_cache))
+        
+        return {
+            "attestations": attestation_options,
+            "evidence": evidence_options,
+            "anchors": anchor_options,
+            "meta": meta_options,
+        }
+    
+    def _migrate_prefixed_keys(self) -> None:
+        """Move keys of the old prefixed layout into their column families"""
+        for prefix, name in self._LEGACY_PREFIXES:
+            handle = self.db.get_column_family_handle(name)
+            batch = WriteBatch()
+            for key, value in self.db.items(from_key=prefix):
+                if not key.startswith(prefix):
+                    break
+                batch.put(key[len(prefix):], value, handle)
+                batch.delete(key)
+            if batch.len():
+                self.db.write(batch)
+    
+    def _migrate_anchor_keys(self) -> None:
+        """
+        Rekey anchors stored under decimal-text indices.
+        
+        That layout kept an anchor_count in meta; its presence marks a
+        database still to convert, and it is dropped in the same batch.
+        """
+        if self._meta.get(b"anchor_count") is None:
+            return
+        anchors_cf = self.db.get_column_family_handle("anchors")
+        batch = WriteBatch()
+        for key, value in self._anchors.items():
+            batch.delete(key, anchors_cf)
+            batch.put(_anchor_key(int(key)), value, anchors_cf)
+        batch.delete(b"anchor_count", self._meta_cf)
+        self.db.write(batch)
+    
+    def _migrate_hex_keys(self) -> None:
+        """
+        Rekey attestations and evidence stored under 64-char hex text IDs.
+        
+        Keys that are not a valid ID can never be read by any ID, so they
+        are dropped and logged instead of being left to be counted and
+        listed. Databases converted by a version that skipped such keys
+        (key_format "binary") are swept once for leftovers.
+        """
+        key_format = self._get_meta("key_format")
+        if key_format == "binary-v2":
+            return
+        dropped_attestations = False
+        for family, name in ((self._attestations, "attestations"), (self._evidence, "evidence")):
+            handle = self.db.get_column_family_handle(name)
+            batch = WriteBatch()
+            dropped = []
+            for key, value in family.items():
+                if key_format == "binary" and len(key) == 32:
+                    continue
+                batch.delete(key, handle)
+                try:
+                    batch.put(_attestation_key(key.decode()), value, handle)
+                except ValueError:
+                    dropped.append(key)
+            if batch.len():
+                self.db.write(batch)
+            if dropped:
+                print(f"[WARN] Dropped {len(dropped)} {name} rows with malformed IDs: "
+                      f"{', '.join(repr(key) for key in dropped[:5])}")
+                dropped_attestations |= name == "attestations"
+        if dropped_attestations:
+            # Stored counts included the dropped rows; recount on open
+            batch = WriteBatch()
+            batch.delete(b"attestation_count", self._meta_cf)
+            batch.delete(_counter_key("attestations"), self._meta_cf)
+            self.db.write(batch)
+        self._set_meta("key_format", "binary-v2")
+    
+    def _migrate_json_counters(self) -> None:
+        """Move the JSON-encoded attestation_count to a fixed-width counter"""
+        legacy = self._get_meta("attestation_count")
+        if legacy is None:
+            return
+        batch = WriteBatch()
+        batch.put(_counter_key("attestations"), legacy.to_bytes(8, "big"), self._meta_cf)
+        batch.delete(b"attestation_count", self._meta_cf)
+        self.db.write(batch)
+    
     def _get_meta(self, key: str, default=None):
         """Get metadata value"""
-        full_key = self._meta_prefix + key.encode()
-        value = self.db.get(full_key)
+        value = self._meta.get(key.encode())
         if value is None:
             return default
-        return json.loads(value)
+        return orjson.loads(value)
     
     def _set_meta(self, key: str, value):
         """Set metadata value"""
-        full_key = self._meta_prefix + key.encode()
-        self.db[full_key] = json.dumps(value)
+        self._meta.put(key.encode(), orjson.dumps(value), self._write_options)
+    
+    def _get_counter(self, name: str) -> Optional[int]:
+        """Get a counter stored as an 8-byte big-endian integer"""
+        value = self._meta.get(_counter_key(name))
+        if value is None:
+            return None
+        return int.from_bytes(value, "big")
+    
+    def _set_counter(self, name: str, value: int) -> None:
+        """Set a counter as an 8-byte big-endian integer (no JSON codec)"""
+        self._meta.put(_counter_key(name), value.to_bytes(8, "big"), self._write_options)
     
     # =========================================================================
     # Attestation Operations
     # =========================================================================
     
     def put_attestation(self, attestation_id: str, attestation) -> None:
-        """Store attestation"""
-        key = self._attestation_prefix + attestation_id.lower().encode()
-        # Convert to dict, then JSON
-        if isinstance(attestation, dict):
-            data = attestation
-        elif hasattr(attestation, 'model_dump'):
-            data = attestation.model_dump()
-        elif hasattr(attestation, 'dict'):
-            data = attestation.dict()
-        else:
-            data = asdict(attestation)
-        self.db[key] = json.dumps(data)
+        """
+        Store attestation.
+        
+        Values are written as compact orjson bytes. Rows written as JSON
+        strings by older versions read back the same way.
+        """
+        self.put_attestation_raw(attestation_id, _encode_record(attestation))
+    
+    def put_attestation_raw(self, attestation_id: str, value: bytes) -> None:
+        """
+        Store an attestation that is already serialized as JSON bytes.
+        
+        The bytes are written as given, with no parse or re-encode, and
+        are what get_attestation_raw returns.
+        """
+        key = _attestation_key(attestation_id)
+        
+        if self.has_attestation(key):
+            self._attestations.put(key, value, self._write_options)  # Overwrite, count unchanged
+            return
+        
+        # New attestation: write it and the bumped counter atomically
+        batch = WriteBatch()
+        batch.put(key, value, self._attestations_cf)
+        batch.put(_counter_key("attestations"), (self._attestation_count + 1).to_bytes(8, "big"), self._meta_cf)
+        self.db.write(batch, self._write_options)
+        self._attestation_count += 1
+    
+    def put_attestations_bulk(self, items: List[Tuple[str, Any]]) -> int:
+        """
+        Store many attestations in a single atomic write.
+        
+        One WriteBatch (and one WAL append) covers the whole list plus the
+        counter update, instead of one write per attestation. Combine with
+        bulk_mode() for initial loads.
+        
+        Args:
+            items: (attestation_id, attestation) pairs
+        
+        Returns:
+            Number of attestations that were not stored before
+        """
+        batch = WriteBatch()
+        new_keys = set()
+        for attestation_id, attestation in items:
+            key = _attestation_key(attestation_id)
+            if key not in new_keys and not self.has_attestation(key):
+                new_keys.add(key)
+            batch.put(key, _encode_record(attestation), self._attestations_cf)
+        
+        batch.put(
+            _counter_key("attestations"),
+            (self._attestation_count + len(new_keys)).to_bytes(8, "big"),
+            self._meta_cf
+        )
+        self.db.write(batch, self._write_options)
+        self._attestation_count += len(new_keys)
+        return len(new_keys)
+    
+    def bulk_ingest_attestations(self, items: Iterable[Tuple[str, Any]]) -> int:
+        """
+        Load attestations by writing a sorted SST file and ingesting it.
+        
+        For initial hydration or migration: the file is built outside the
+        database and linked straight into the LSM tree, bypassing the WAL,
+        the memtable and the compactions a stream of puts would cause.
+        Later items win over earlier ones with the same ID, and ingested
+        values replace stored ones.
+        
+        Args:
+            items: (attestation_id, attestation) pairs; attestations that
+                are already JSON bytes are stored as they are
+        
+        Returns:
+            Number of attestations that were not stored before
+        """
+        values = {}
+        for attestation_id, attestation in items:
+            values[_attestation_key(attestation_id)] = (
+                attestation if isinstance(attestation, bytes) else _encode_record(attestation)
+            )
+        if not values:
+            return 0
+        new_count = sum(1 for key in values if not self.has_attestation(key))
+        
+        # SST files need keys in strictly increasing order
+        work_dir = tempfile.mkdtemp(dir=os.path.dirname(self.db_path) or ".")
+        try:
+            sst_path = os.path.join(work_dir, "attestations.sst")
+            writer = SstFileWriter(self._family_options["attestations"])
+            writer.open(sst_path)
+            for key in sorted(values):
+                writer[key] = values[key]
+            writer.finish()
+            
+            ingest_options = IngestExternalFileOptions()
+            ingest_options.set_move_files(True)
+            self._attestations.ingest_external_file([sst_path], ingest_options)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        
+        self._attestation_count += new_count
+        self._set_counter("attestations", self._attestation_count)
+        return new_count
     
     def get_attestation(self, attestation_id: str) -> Optional[dict]:
         """Get attestation by ID"""
-        key = self._attestation_prefix + attestation_id.lower().encode()
-        value = self.db.get(key)
+        key = _lookup_key(attestation_id)
+        value = self._attestations.get(key) if key is not None else None
+        if value is None:
+            return None
+        return orjson.loads(value)
+    
+    def get_attestations(self, attestation_ids: List[str]) -> List[Optional[dict]]:
+        """
+        Get many attestations with one multi-get.
+        
+        RocksDB's MultiGet batches the lookups (sharing SST and block
+        reads) and the call crosses into RocksDB once instead of once per
+        ID.
+        
+        Returns:
+            Attestations in the same order as attestation_ids
+            (None for IDs not stored)
+        """
+        if not attestation_ids:
+            return []
+        keys = [_lookup_key(i) for i in attestation_ids]
+        if None in keys:
+            # Malformed IDs read as missing; fetch only the valid ones
+            found = iter(self._attestations.get([key for key in keys if key is not None]))
+            values = [next(found) if key is not None else None for key in keys]
+        else:
+            values = self._attestations.get(keys)
+        return [orjson.loads(value) if value is not None else None for value in values]
+    
+    def get_attestation_raw(self, attestation_id: str) -> Optional[bytes]:
+        """Get attestation as its stored JSON encoding, without parsing"""
+        key = _lookup_key(attestation_id)
+        value = self._attestations.get(key) if key is not None else None
         if value is None:
             return None
-        return json.loads(value)
+        return value.encode() if isinstance(value, str) else value
     
     def has_attestation(self, attestation_id: str) -> bool:
-        """Check if attestation exists"""
-        key = self._attestation_prefix + attestation_id.lower().encode()
-        return self.db.get(key) is not None
+        """
+        Check if attestation exists.
+        
+        key_may_exist answers from the memtable and bloom filters without
+        reading a data block: a definite miss is False straight away, and a
+        value found in memory is a definite hit. Only an undecided probe
+        falls back to a full get. A malformed ID is simply not stored.
+        """
+        key = _lookup_key(attestation_id)
+        if key is None:
+            return False
+        may_exist, value = self._attestations.key_may_exist(key, True)
+        if not may_exist:
+            return False
+        if value is not None:
+            return True
+        return self._attestations.get(key) is not None
     
     @property
     def attestation_count(self) -> int:
         """Count attestations (cached for performance)"""
-        count = 0
-        for key in self.db.keys():
-            if key.startswith(self._attestation_prefix):
-                count += 1
+        return self._attestation_count
+    
+    def recompute_attestation_count(self) -> int:
+        """Recount attestations with a full scan and store the result"""
+        count = sum(1 for _ in self._attestations.keys(read_opt=self._scan_options()))
+        self._attestation_count = count
+        self._set_counter("attestations", count)
         return count
     
+    @staticmethod
+    def _scan_options() -> "ReadOptions":
+        """
+        Read options for full scans of a column family.
+        
+        A large readahead lets RocksDB prefetch sequential blocks, and the
+        scanned blocks are kept out of the block cache so one export or
+        recount doesn't evict the point-lookup working set.
+        """
+        read_options = ReadOptions()
+        read_options.set_readahead_size(256 << 10)
+        read_options.fill_cache(False)
+        return read_options
+    
+    @contextmanager
+    def snapshot(self) -> Iterator["AttestationSnapshot"]:
+        """
+        Consistent point-in-time view of the attestations family.
+        
+        Point reads through the yielded view (view.get(attestation_id))
+        see the attestations as of entry, however long the job runs and
+        whatever is ingested meanwhile. A single scan such as
+        iter_attestation_ids is already consistent on its own: RocksDB
+        iterators pin their view when created. The view drops the only
+        reference to the RocksDB snapshot on exit, which releases it, and
+        cannot be read from afterwards.
+        """
+        view = AttestationSnapshot(self._attestations.snapshot())
+        try:
+            yield view
+        finally:
+            view.release()
+    
     def iter_attestation_ids(self) -> Iterator[str]:
-        """Iterate over all attestation IDs"""
-        for key in self.db.keys():
-            if key.startswith(self._attestation_prefix):
-                yield key[len(self._attestation_prefix):].decode()
+        """Iterate over all attestation IDs (as of the start of the scan)"""
+        # The attestations family holds nothing else, so the scan is
+        # bounded to attestation keys without any prefix check
+        for key in self._attestations.keys(read_opt=self._scan_options()):
+            yield key.hex()
     
     # =========================================================================
     # Evidence Operations
     # =========================================================================
     
-    def put_evidence(self, attestation_id: str, evidence: str) -> None:
-        """Store evidence"""
-        key = self._evidence_prefix + attestation_id.lower().encode()
-        self.db[key] = evidence
-    
-    def get_evidence(self, attestation_id: str) -> Optional[str]:
-        """Get evidence by attestation ID"""
-        key = self._evidence_prefix + attestation_id.lower().encode()
-        return self.db.get(key)
+    def put_evidence(self, attestation_id: str, evidence: Union[str, bytes, memoryview]) -> None:
+        """
+        Store evidence.
+        
+        Evidence is stored as UTF-8 bytes. Bytes are written as given;
+        only str is encoded (and a memoryview copied, as rocksdict needs
+        bytes).
+        """
+        if isinstance(evidence, str):
+            evidence = evidence.encode()
+        elif isinstance(evidence, memoryview):
+            evidence = evidence.tobytes()
+        self._evidence.put(_attestation_key(attestation_id), evidence, self._write_options)
+    
+    def get_evidence(self, attestation_id: str) -> Optional[bytes]:
+        """Get evidence by attestation ID as stored bytes, without decoding"""
+        key = _lookup_key(attestation_id)
+        value = self._evidence.get(key) if key is not None else None
+        if isinstance(value, str):
+            return value.encode()  # Row written as str by an older version
+        return value
+    
+    def get_evidence_str(self, attestation_id: str) -> Optional[str]:
+        """Get evidence by attestation ID decoded as text"""
+        key = _lookup_key(attestation_id)
+        value = self._evidence.get(key) if key is not None else None
+        if isinstance(value, bytes):
+            return value.decode()
+        return value
     
     # =========================================================================
     # Anchor Operations
@@ -131,30 +624,17 @@ class RocksDBStorage:
     def add_anchor(self, anchor) -> int:
         """Add anchor and return index"""
         index = self._anchor_count
-        key = self._anchor_prefix + str(index).encode()
-        
-        if isinstance(anchor, dict):
-            data = anchor
-        elif hasattr(anchor, 'model_dump'):
-            data = anchor.model_dump()
-        elif hasattr(anchor, 'dict'):
-            data = anchor.dict()
-        else:
-            data = asdict(anchor)
-        
-        self.db[key] = json.dumps(data)
+        self._anchors.put(_anchor_key(index), _encode_record(anchor), self._write_options)
         self._anchor_count += 1
-        self._set_meta("anchor_count", self._anchor_count)
         return index
     
     def get_latest_anchor(self) -> Optional[dict]:
         """Get most recent anchor"""
         if self._anchor_count == 0:
             return None
-        key = self._anchor_prefix + str(self._anchor_count - 1).encode()
-        value = self.db.get(key)
+        value = self._anchors.get(_anchor_key(self._anchor_count - 1))
         if value:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
     
     @property
@@ -167,18 +647,76 @@ class RocksDBStorage:
     
     def close(self):
         """Close database"""
+        # Column family views hold the DB open until they are closed
+        for family in (self._attestations, self._evidence, self._anchors, self._meta):
+            family.close()
+        self._attestations_cf = self._meta_cf = None
         self.db.close()
         print(f"[DB] RocksDB closed: {self.db_path}")
     
+    def stats(self) -> Dict[str, Any]:
+        """
+        RocksDB statistics for tuning.
+        
+        Per-family key estimates and block cache usage are always
+        available. Ticker counts (cache hit/miss, bloom filter useful,
+        memtable hit/miss) and the rocksdb.stats dump need enable_stats.
+        """
+        result: Dict[str, Any] = {
+            "enabled": self._stats_options is not None,
+            "block_cache_usage": self.db.property_int_value("rocksdb.block-cache-usage"),
+            "estimate_num_keys": {
+                name: family.property_int_value("rocksdb.estimate-num-keys")
+                for name, family in (
+                    ("attestations", self._attestations),
+                    ("evidence", self._evidence),
+                    ("anchors", self._anchors),
+                    ("meta", self._meta),
+                )
+            },
+        }
+        if self._stats_options is None:
+            return result
+        
+        # Ticker lines read "<name> COUNT : <n>"; histogram lines carry
+        # percentiles and are left to the raw dump
+        tickers = {}
+        for line in (self._stats_options.get_statistics() or "").splitlines():
+            parts = line.split()
+            if len(parts) == 4 and parts[1] == "COUNT":
+                tickers[parts[0]] = int(parts[3])
+        result["tickers"] = {name: tickers.get(name, 0) for name in self._STATS_TICKERS}
+        result["rocksdb.stats"] = self.db.property_value("rocksdb.stats")
+        return result
+    
     def flush(self):
         """Flush writes to disk"""
         # rocksdict automatically flushes
         pass
     
+    @contextmanager
+    def bulk_mode(self):
+        """
+        Skip the write-ahead log for a bulk load.
+        
+        Writes inside the block are not synced and bypass the WAL, so a
+        crash mid-load loses them; memtables are flushed to SST files on
+        exit to make the load durable. Not for normal serving.
+        """
+        bulk_options = WriteOptions()
+        bulk_options.disable_wal = True
+        bulk_options.sync = False
+        self._write_options = bulk_options
+        try:
+            yield self
+        finally:
+            self._write_options = WriteOptions()
+            for family in (self._attestations, self._evidence, self._anchors, self._meta):
+                family.flush()
+    
     def destroy(self):
         """Delete database"""
         self.close()
-        import shutil
         if os.path.exists(self.db_path):
             shutil.rmtree(self.db_path)
         print(f"[DB] RocksDB destroyed: {self.db_path}")
@@ -188,24 +726,63 @@ class RocksDBStorage:
 # Adapter to match in-memory Storage interface
 # =============================================================================
 
+class AttestationSnapshot:
+    """
+    Point reads against a snapshot of the attestations family.
+    
+    Only lookups are offered: iterating a rocksdict snapshot is not
+    isolated from later writes.
+    """
+    
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+    
+    def get(self, attestation_id: str) -> Optional[dict]:
+        """Get attestation by ID as of the snapshot"""
+        if self._snapshot is None:
+            raise RuntimeError("Snapshot already released")
+        key = _lookup_key(attestation_id)
+        if key is None:
+            return None
+        try:
+            value = self._snapshot[key]
+        except Exception as exc:
+            # rocksdict snapshots report a missing key with a bare Exception
+            if str(exc) != "key not found":
+                raise
+            return None
+        return orjson.loads(value)
+    
+    def release(self) -> None:
+        """Drop the snapshot so RocksDB can reclaim what it pins"""
+        self._snapshot = None
+
+
 class StorageAdapter:
     """
     Adapter that provides same interface as in-memory Storage
     but uses RocksDB backend.
     """
     
-    def __init__(self, db_path: str = "./data/zone.db"):
-        self._db = RocksDBStorage(db_path)
+    def __init__(self, db_path: str = "./data/zone.db", cache_size_mb: int = 512,
+                 enable_stats: bool = False):
+        self._db = RocksDBStorage(db_path, cache_size_mb, enable_stats)
         
         # Property-like access for backwards compatibility
         self._attestations_proxy = AttestationsProxy(self._db)
+        self._attestation_bytes_proxy = AttestationBytesProxy(self._db)
         self._evidence_proxy = EvidenceProxy(self._db)
         self._anchors_proxy = AnchorsProxy(self._db)
+        self._latest_anchor = self._db.get_latest_anchor()
     
     @property
     def attestations(self):
         return self._attestations_proxy
     
+    @property
+    def attestation_bytes(self):
+        return self._attestation_bytes_proxy
+    
     @property
     def evidence(self):
         return self._evidence_proxy
@@ -214,6 +791,17 @@ class StorageAdapter:
     def anchors(self):
         return self._anchors_proxy
     
+    @property
+    def latest_anchor(self):
+        return self._latest_anchor
+    
+    def append_anchor(self, anchor) -> None:
+        self._db.add_anchor(anchor)
+        self._latest_anchor = anchor
+    
+    def stats(self) -> Dict[str, Any]:
+        return self._db.stats()
+    
     def close(self):
         self._db.close()
 
@@ -234,6 +822,14 @@ class AttestationsProxy:
         result = self._db.get_attestation(key)
         return result if result is not None else default
     
+    def get_many(self, keys: List[str]) -> dict:
+        """Attestations for the stored keys among keys, read in one batch"""
+        return {
+            key: result
+            for key, result in zip(keys, self._db.get_attestations(keys))
+            if result is not None
+        }
+    
     def __setitem__(self, key: str, value):
         self._db.put_attestation(key, value)
     
@@ -247,6 +843,31 @@ class AttestationsProxy:
         return self._db.iter_attestation_ids()
 
 
+class AttestationBytesProxy:
+    """
+    Dict-like proxy for serialized attestations.
+    
+    RocksDB already stores each attestation as JSON, so reads return
+    that encoding and writes store the given bytes as they are.
+    """
+    
+    def __init__(self, db: RocksDBStorage):
+        self._db = db
+    
+    def __getitem__(self, key: str) -> bytes:
+        result = self._db.get_attestation_raw(key)
+        if result is None:
+            raise KeyError(key)
+        return result
+    
+    def get(self, key: str, default=None):
+        result = self._db.get_attestation_raw(key)
+        return result if result is not None else default
+    
+    def __setitem__(self, key: str, value: bytes):
+        self._db.put_attestation_raw(key, value)
+
+
 class EvidenceProxy:
     """Dict-like proxy for evidence"""
     
@@ -254,20 +875,26 @@ class EvidenceProxy:
         self._db = db
     
     def __getitem__(self, key: str):
-        result = self._db.get_evidence(key)
+        result = self._db.get_evidence_str(key)
         if result is None:
             raise KeyError(key)
         return result
     
     def get(self, key: str, default=None):
-        return self._db.get_evidence(key) or default
+        result = self._db.get_evidence_str(key)
+        return result if result is not None else default
     
-    def __setitem__(self, key: str, value: str):
+    def __setitem__(self, key: str, value: Union[str, bytes]):
         self._db.put_evidence(key, value)
 
 
 class AnchorsProxy:
-    """List-like proxy for anchors"""
+    """
+    Read-only list-like proxy for anchors.
+    
+    New anchors go through StorageAdapter.append_anchor, which also keeps
+    latest_anchor current.
+    """
     
     def __init__(self, db: RocksDBStorage):
         self._db = db
@@ -277,9 +904,6 @@ class AnchorsProxy:
             return self._db.get_latest_anchor()
         raise IndexError("Only index -1 supported for anchors")
     
-    def append(self, anchor):
-        self._db.add_anchor(anchor)
-    
     def __len__(self) -> int:
         return self._db.anchor_count
     
@@ -297,15 +921,16 @@ if __name__ == "__main__":
     # Create test storage
     storage = RocksDBStorage("./test_db")
     
-    # Test attestation storage
+    # Test attestation storage (IDs are 64-char hex, stored as 32-byte keys)
+    test_id = "ab" * 32
     test_att = {
-        "attestation_id": "abc123",
+        "attestation_id": test_id,
         "zone_id": "zone1",
         "claim_hash": "hash1"
     }
-    storage.put_attestation("abc123", test_att)
+    storage.put_attestation(test_id, test_att)
     
-    result = storage.get_attestation("abc123")
+    result = storage.get_attestation(test_id)
     print(f"Stored: {result}")
     
     print(f"Count: {storage.attestation_count}")